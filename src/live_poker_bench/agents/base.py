@@ -1,11 +1,14 @@
 """Base agent interface for poker players."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any, Literal
 
 
-@dataclass
+@dataclass(slots=True)
 class Observation:
     """Game state observation sent to an agent."""
 
@@ -32,17 +35,46 @@ class Observation:
 
     # Table state
     button_seat: int
-    players: list[dict[str, Any]]  # List of {seat, name, stack, is_active, is_folded}
+    players: Sequence[Mapping[str, Any]]  # List of {seat, name, stack, is_active, is_folded}
 
     # Action history this hand
-    actions_this_hand: list[dict[str, Any]] = field(default_factory=list)
+    actions_this_hand: Sequence[Mapping[str, Any]] = field(default_factory=tuple)
 
     # Legal actions
     legal_actions: list[str] = field(default_factory=list)  # ["fold", "call", "raise"]
 
+    # Column views of `players`, derived once so prompt building avoids per-row dict lookups
+    player_seats: tuple[int, ...] = field(init=False, default=())
+    player_names: tuple[str, ...] = field(init=False, default=())
+    player_stacks: tuple[int, ...] = field(init=False, default=())
+    player_folded: tuple[bool, ...] = field(init=False, default=())
+    player_active: tuple[bool, ...] = field(init=False, default=())
+    legal_action_set: frozenset[str] = field(init=False, default=frozenset())
+
+    # Memoized to_dict() result; the observation does not change once built
+    _dict: dict[str, Any] | None = field(init=False, default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Freeze the table state so traces can hold on to the observation
+        # without defensive copies
+        self.players = tuple(MappingProxyType(dict(p)) for p in self.players)
+        self.actions_this_hand = tuple(MappingProxyType(dict(a)) for a in self.actions_this_hand)
+
+        self.player_seats = tuple(p["seat"] for p in self.players)
+        self.player_names = tuple(p["name"] for p in self.players)
+        self.player_stacks = tuple(p["stack"] for p in self.players)
+        self.player_folded = tuple(bool(p.get("is_folded")) for p in self.players)
+        self.player_active = tuple(bool(p.get("is_active")) for p in self.players)
+        self.legal_action_set = frozenset(self.legal_actions)
+
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
+        """Convert to dictionary for serialization.
+
+        The result is built once and shared between calls; treat it as read-only.
+        """
+        if self._dict is not None:
+            return self._dict
+        self._dict = {
             "hand_number": self.hand_number,
             "street": self.street,
             "my_seat": self.my_seat,
@@ -57,13 +89,14 @@ class Observation:
             "small_blind": self.small_blind,
             "big_blind": self.big_blind,
             "button_seat": self.button_seat,
-            "players": self.players,
-            "actions_this_hand": self.actions_this_hand,
+            "players": [dict(p) for p in self.players],
+            "actions_this_hand": [dict(a) for a in self.actions_this_hand],
             "legal_actions": self.legal_actions,
         }
+        return self._dict
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentAction:
     """Action returned by an agent."""
 
@@ -111,6 +144,21 @@ class BaseAgent(ABC):
         """
         pass
 
+    async def aget_action(self, observation: Observation) -> AgentAction:
+        """Async variant of `get_action`.
+
+        Defaults to running `get_action` in a worker thread, so a blocking
+        agent does not stall other decisions awaited alongside it. Agents
+        with a native async path override this.
+
+        Args:
+            observation: Current game state from the agent's perspective.
+
+        Returns:
+            The agent's chosen action.
+        """
+        return await asyncio.to_thread(self.get_action, observation)
+
     def reset(self) -> None:
         """Reset the agent's state for a new tournament.
 
@@ -1,20 +1,30 @@
 """LLM-backed agent with multi-turn tool loop."""
 
 import json
+import math
 import re
 import time
-from dataclasses import dataclass, field
+import weakref
+from dataclasses import astuple, dataclass, field
 from typing import Any
 
+from pydantic_core import from_json
+
 from live_poker_bench.agents.base import AgentAction, BaseAgent, Observation
 from live_poker_bench.agents.memory import AgentMemory
 from live_poker_bench.agents.tools import TOOL_DEFINITIONS, execute_tool
-from live_poker_bench.llm.adapter import LLMAdapter, LLMConfig, ProviderSettings, ReasoningSettings
+from live_poker_bench.llm.adapter import (
+    LLMAdapter,
+    LLMConfig,
+    ProviderSettings,
+    ReasoningSettings,
+    run_sync,
+)
 
 
 SYSTEM_PROMPT = """You are playing No-Limit Texas Hold'em poker in a tournament. Your goal is to win chips and ultimately win the tournament.
 
-You have access to memory tools to recall information about past hands and opponent behavior. Use these tools strategically to inform your decisions.
+You have access to memory tools to recall information about past hands and opponent behavior. Use these tools strategically to inform your decisions. When you need several lookups, request them all in one response as parallel tool calls.
 
 When you decide on an action, respond with a JSON object in this exact format:
 {
@@ -38,12 +48,315 @@ Think step by step about:
 4. Pot odds and implied odds
 5. Tournament considerations (stack preservation vs. accumulation)"""
 
+# Shared by every request; the adapter copies the message list, never the dicts in it
+_SYSTEM_MESSAGE: dict[str, Any] = {"role": "system", "content": SYSTEM_PROMPT}
+# Anthropic models only cache prompt prefixes that are explicitly marked. OpenAI-style
+# providers cache identical prefixes automatically, so they get the plain message.
+_CACHED_SYSTEM_MESSAGE: dict[str, Any] = {
+    "role": "system",
+    "content": [
+        {"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+    ],
+}
+
+# Same tool list with a cache breakpoint on the last definition, so Anthropic
+# caches the tool schemas as their own prefix (tools are sent before the system prompt)
+_CACHED_TOOL_DEFINITIONS: list[dict[str, Any]] = [
+    *TOOL_DEFINITIONS[:-1],
+    {**TOOL_DEFINITIONS[-1], "cache_control": {"type": "ephemeral"}},
+]
+
+_JSON_DECODER = json.JSONDecoder()
+# Above this length the object scanner anchors on the key instead of trying every "{"
+_ANCHORED_SCAN_MIN_CHARS = 4096
+
+# Entries kept by the optional decision cache before the oldest is evicted
+_DECISION_CACHE_SIZE = 4096
+
+# Adaptive tool offering: EMA decay, the average below which tools are dropped,
+# and how often (in decisions) they are offered anyway
+_TOOL_EMA_DECAY = 0.9
+_TOOL_EMA_THRESHOLD = 0.2
+_TOOL_PROBE_INTERVAL = 10
+
+# Near-miss normalization: spellings we can map locally instead of asking the model again
+_ACTION_ALIASES = {
+    "bet": "raise",
+    "all-in": "raise",
+    "all in": "raise",
+    "allin": "raise",
+    "all_in": "raise",
+    "shove": "raise",
+}
+# Raise amounts within this factor of the legal range are clamped into it;
+# anything further off is treated as a misparse and sent back to the model
+_RAISE_CLAMP_FACTOR = 2
+_ALL_IN_ALIASES = frozenset({"all-in", "all in", "allin", "all_in", "shove"})
+_VALID_ACTIONS = frozenset({"fold", "check", "call", "raise"})
+# Lowercased model output -> canonical action; values are the interned literals
+_CANONICAL_ACTIONS = {action: action for action in _VALID_ACTIONS} | _ACTION_ALIASES
+# A chip count with optional thousands separators and decimals, e.g. "1,500" or "60.00";
+# atomic so a failed lookahead can't retry with a shorter number
+_AMOUNT = r"(?>(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?)"
+# A whole raise_to string: the amount plus an optional "$" or "chips"
+_AMOUNT_RE = re.compile(rf"\$?\s*({_AMOUNT})\s*(?:chips?)?", re.IGNORECASE)
+# An explicit target in prose ("raise to 600", "bet $600"), but not a multiplier
+# or ratio such as "bet 3x the pot" or "raise to 50% pot"
+_RAISE_TO_RE = re.compile(
+    rf"\b(?:raise\s+to|bet)\s+\$?({_AMOUNT})"
+    r"(?![.,]?\d|\s*(?:x\b|×|%|times\b|bb\b|big\s+blinds?\b))",
+    re.IGNORECASE,
+)
+
+
+def _load_strict_json(text: str, key: str = "action") -> dict[str, Any] | None:
+    """Decode a response that is nothing but a JSON object, bare or fenced.
+
+    This is the common case for well-behaved models and avoids scanning
+    the text brace by brace.
+
+    Args:
+        text: The response text.
+        key: Key the object must contain.
+
+    Returns:
+        The decoded object, or None if the text is not of that shape.
+    """
+    candidate = text.strip()
+    if not candidate.startswith("{"):
+        parts = candidate.split("```", 2)
+        # Only the first fenced block, and only when no object precedes it
+        if len(parts) < 3 or "{" in parts[0]:
+            return None
+        candidate = parts[1].removeprefix("json").strip()
+    try:
+        obj = from_json(candidate)
+    except ValueError:
+        return None
+    if isinstance(obj, dict) and key in obj:
+        return obj
+    return None
+
+
+def _find_json_object(text: str, key: str = "action") -> dict[str, Any] | None:
+    """Find the first JSON object in text that has the given top-level key.
+
+    Decodes from each "{" left to right with `raw_decode`, so nested objects,
+    braces inside strings and trailing prose are all handled.
+
+    Args:
+        text: Text that may contain a JSON object.
+        key: Key the object must contain.
+
+    Returns:
+        The decoded object, or None if no such object is found.
+    """
+    if len(text) > _ANCHORED_SCAN_MIN_CHARS:
+        return _find_json_object_anchored(text, key)
+
+    start = text.find("{")
+    while start != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, start)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(obj, dict) and key in obj:
+                return obj
+        # Keep scanning inside a non-matching object as well: the action may be nested
+        start = text.find("{", start + 1)
+    return None
+
+
+def _find_json_object_anchored(text: str, key: str) -> dict[str, Any] | None:
+    """Variant of `_find_json_object` for long texts.
+
+    Long tool-heavy responses contain many braces that are not the answer.
+    Instead of decoding at every "{", start from each occurrence of the
+    quoted key and only try the braces in front of it, nearest first.
+    """
+    needle = f'"{key}"'
+    # Braces before the previous occurrence were already tried for it
+    tried_before = 0
+    pos = text.find(needle)
+    while pos != -1:
+        start = text.rfind("{", tried_before, pos)
+        while start != -1:
+            try:
+                obj, _ = _JSON_DECODER.raw_decode(text, start)
+            except json.JSONDecodeError:
+                pass
+            else:
+                if isinstance(obj, dict) and key in obj:
+                    return obj
+            start = text.rfind("{", tried_before, start)
+        tried_before = pos
+        pos = text.find(needle, pos + len(needle))
+    return None
+
+
+def _only_sensible_action(observation: Observation) -> str | None:
+    """The action to take when the observation leaves no real choice.
+
+    Folding is never better than a free check, so it does not count as an
+    option when check is legal. A player with no chips behind can only
+    check or call.
+
+    Returns:
+        The forced action, or None if there is a decision to make.
+    """
+    legal = observation.legal_action_set
+    if observation.my_stack == 0:
+        if "check" in legal:
+            return "check"
+        return "call" if "call" in legal else None
+    choices = [a for a in observation.legal_actions if not (a == "fold" and "check" in legal)]
+    return choices[0] if len(choices) == 1 else None
+
+
+def _uses_cache_control(model: str) -> bool:
+    """Whether a model needs explicit cache_control markers for prompt caching."""
+    model = model.lower()
+    return "anthropic/" in model or "claude" in model
+
+
+def _frozen(value: Any) -> Any:
+    """Turn the lists and tuples from `dataclasses.astuple` into nested tuples."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(v) for v in value)
+    return value
+
+
+def _adapter_key(config: LLMConfig) -> tuple:
+    """Hashable key covering every LLMConfig field, nested settings included."""
+    return _frozen(astuple(config))
+
+
+def _has_action_json(text: str) -> bool:
+    """Whether text already contains a complete action JSON object."""
+    return '"action"' in text and _find_json_object(text) is not None
+
+
+def _decision_key(observation: Observation) -> tuple:
+    """Canonical key for the decision cache.
+
+    Stack, pot and bet sizes are bucketed in big blinds, so states that differ
+    only by a few chips share an entry.
+    """
+    bb = observation.big_blind or 1
+    return (
+        observation.street,
+        observation.my_hole_cards,
+        observation.community_cards,
+        observation.my_position,
+        observation.my_stack // bb,
+        observation.pot_size // bb,
+        observation.current_bet // bb,
+        tuple(
+            (a["street"], a["seat"], a["action"], a.get("amount") or 0)
+            for a in observation.actions_this_hand
+        ),
+        tuple(observation.legal_actions),
+    )
+
+
+_RANK_ORDER = {rank: i for i, rank in enumerate("23456789TJQKA")}
+# Depth buckets in big blinds: short, medium, deep, ...
+_BB_BUCKETS = (0, 5, 10, 20, 40, 80)
+
+
+def _bb_bucket(chips: int, big_blind: int) -> int:
+    """Index of the big-blind depth bucket that chips fall into."""
+    depth = chips / (big_blind or 1)
+    return sum(1 for edge in _BB_BUCKETS if depth > edge)
+
+
+def _hand_class(cards: tuple[str, ...]) -> str:
+    """Hand class like "AKs", "T9o" or "77"."""
+    (r1, s1), (r2, s2) = sorted(
+        ((c[0], c[1]) for c in cards), key=lambda c: _RANK_ORDER.get(c[0], -1), reverse=True
+    )
+    if r1 == r2:
+        return r1 + r2
+    return r1 + r2 + ("s" if s1 == s2 else "o")
+
+
+def _board_texture(cards: tuple[str, ...]) -> tuple:
+    """Coarse board texture: size, max suit count, paired, high card."""
+    if not cards:
+        return ()
+    ranks = [c[0] for c in cards]
+    suits = [c[1] for c in cards]
+    return (
+        len(cards),
+        max(suits.count(s) for s in set(suits)),
+        len(set(ranks)) < len(ranks),
+        max(ranks, key=lambda r: _RANK_ORDER.get(r, -1)),
+    )
+
+
+def _near_match_key(observation: Observation) -> tuple:
+    """Coarse key for the near-match decision cache.
+
+    Ignores exact cards, names and chip counts in favour of hand class, board
+    texture, position, depth buckets and the number of raises this street.
+    """
+    bb = observation.big_blind
+    raises = sum(
+        1 for a in observation.actions_this_hand
+        if a["street"] == observation.street and a["action"] in ("raise", "bet", "all_in")
+    )
+    return (
+        observation.street,
+        _hand_class(observation.my_hole_cards),
+        _board_texture(observation.community_cards),
+        observation.my_position,
+        _bb_bucket(observation.my_stack, bb),
+        _bb_bucket(observation.pot_size, bb),
+        _bb_bucket(observation.current_bet, bb),
+        raises,
+        tuple(observation.legal_actions),
+    )
+
+
+def _cache_put(cache: dict, key: tuple, value: tuple) -> None:
+    """Insert into a decision cache, evicting the oldest entry when full."""
+    if len(cache) >= _DECISION_CACHE_SIZE:
+        # Dicts keep insertion order, so the first key is the oldest
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def _coerce_amount(value: Any) -> int | None:
+    """Coerce a raise amount such as 1500, 1500.0 or "1,500 chips" to an int.
+
+    Negative, non-finite and unparseable amounts give None, so the model is
+    asked again rather than guessed at.
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value if value >= 0 else None
+    if isinstance(value, float):
+        return int(value) if math.isfinite(value) and value >= 0 else None
+    match = _AMOUNT_RE.fullmatch(str(value).strip())
+    if match is None:
+        return None
+    # Parse the digits directly: going through float would overflow on long
+    # strings and round anything above 2**53. Decimals are truncated.
+    whole = match.group(1).replace(",", "").partition(".")[0]
+    try:
+        return int(whole)
+    except (ValueError, OverflowError):
+        # More digits than int() will convert
+        return None
 
-@dataclass
+
+@dataclass(slots=True)
 class DecisionTrace:
     """Trace of a single decision point."""
 
-    observation: dict[str, Any]
+    observation: Observation  # Converted with to_dict() only when traces are read
     street: str = ""
     messages: list[dict[str, Any]] = field(default_factory=list)  # Full conversation
     tool_calls: list[dict[str, Any]] = field(default_factory=list)
@@ -53,11 +366,38 @@ class DecisionTrace:
     error: str | None = None
     forced_fold: bool = False
     thinking_time_ms: float = 0.0
+    cached: bool = False  # Answered from the decision cache without an LLM call
+    _dict: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for logging.
+
+        Traces are complete once recorded, so the dict is built once and reused.
+        """
+        if self._dict is None:
+            self._dict = {
+                "observation": self.observation.to_dict(),
+                "street": self.street,
+                "messages": self.messages,
+                "tool_calls": self.tool_calls,
+                "llm_responses": self.llm_responses,
+                "final_action": self.final_action,
+                "retries": self.retries,
+                "error": self.error,
+                "forced_fold": self.forced_fold,
+                "thinking_time_ms": self.thinking_time_ms,
+                "cached": self.cached,
+            }
+        return self._dict
 
 
 class LLMAgent(BaseAgent):
     """LLM-backed poker agent with multi-turn tool support."""
 
+    # Adapters hold no per-agent state, so agents with identical settings share one.
+    # Entries are weak: an adapter is dropped once no live agent uses it.
+    _adapters: weakref.WeakValueDictionary[tuple, LLMAdapter] = weakref.WeakValueDictionary()
+
     def __init__(
         self,
         name: str,
@@ -67,6 +407,8 @@ class LLMAgent(BaseAgent):
         config: dict[str, Any] | None = None,
         reasoning: dict[str, Any] | None = None,
         provider: dict[str, Any] | None = None,
+        n_samples: int = 1,
+        stream: bool = False,
     ) -> None:
         """Initialize the LLM agent.
 
@@ -90,6 +432,10 @@ class LLMAgent(BaseAgent):
                 - only: list[str] - Only use these providers
                 - ignore: list[str] - Never use these providers
                 - quantizations: list[str] - Allowed quantization levels
+            n_samples: Completions to request per call. Extra samples are
+                checked locally before a retry round-trip is made.
+            stream: Stream responses and stop generation as soon as a
+                complete action JSON object has arrived.
         """
         super().__init__(name, config)
         self.model = model
@@ -121,8 +467,24 @@ class LLMAgent(BaseAgent):
             )
 
         # Initialize LLM adapter
-        llm_config = LLMConfig(model=model, reasoning=reasoning_settings, provider=provider_settings)
-        self.llm = LLMAdapter(llm_config)
+        llm_config = LLMConfig(
+            model=model,
+            reasoning=reasoning_settings,
+            provider=provider_settings,
+            n_samples=n_samples,
+            stream=stream,
+            parallel_tool_calls=True,
+        )
+        adapter_key = _adapter_key(llm_config)
+        self.llm = LLMAgent._adapters.get(adapter_key)
+        if self.llm is None:
+            self.llm = LLMAgent._adapters[adapter_key] = LLMAdapter(llm_config)
+        if _uses_cache_control(model):
+            self._system_message = _CACHED_SYSTEM_MESSAGE
+            self._tools = _CACHED_TOOL_DEFINITIONS
+        else:
+            self._system_message = _SYSTEM_MESSAGE
+            self._tools = TOOL_DEFINITIONS
 
         # Memory will be initialized when seat is set
         self._memory: AgentMemory | None = None
@@ -130,6 +492,22 @@ class LLMAgent(BaseAgent):
         # Trace history for logging
         self.decision_traces: list[DecisionTrace] = []
 
+        # Exact-match cache of validated decisions (opt-in via config["enable_decision_cache"])
+        self._decision_cache: dict[tuple, tuple[str, int | None, str]] | None = (
+            {} if self.config.get("enable_decision_cache") else None
+        )
+        # Coarser cache keyed on hand class and board texture, consulted after an
+        # exact miss (opt-in via config["enable_near_match_cache"])
+        self._near_match_cache: dict[tuple, tuple[str, float | None, str]] | None = (
+            {} if self.config.get("enable_near_match_cache") else None
+        )
+
+        # Moving average of tool calls per LLM call (opt-in via config["adaptive_tool_turns"]);
+        # starts high so early decisions always get the tools
+        self._adaptive_tools = bool(self.config.get("adaptive_tool_turns"))
+        self._avg_tools_used = 1.0
+        self._decisions_since_tools = 0
+
     @property
     def memory(self) -> AgentMemory:
         """Get or create the agent's memory."""
@@ -152,117 +530,123 @@ class LLMAgent(BaseAgent):
 
     def _build_observation_prompt(self, observation: Observation) -> str:
         """Build a human-readable prompt from the observation."""
-        lines = [
-            f"=== Hand #{observation.hand_number} - {observation.street.upper()} ===",
-            "",
-            f"Your Position: {observation.my_position} (Seat {observation.my_seat})",
-            f"Your Cards: {observation.my_hole_cards[0]} {observation.my_hole_cards[1]}",
-            f"Your Stack: {observation.my_stack} chips ({observation.my_stack / observation.big_blind:.1f} BB)",
-            "",
-            f"Blinds: {observation.small_blind}/{observation.big_blind}",
-            f"Pot: {observation.pot_size} chips",
-        ]
-
-        if observation.community_cards:
-            lines.append(f"Board: {' '.join(observation.community_cards)}")
-
-        lines.append("")
-        lines.append("Players at table:")
-        for p in observation.players:
-            status = ""
-            if p.get("is_folded"):
-                status = " (folded)"
-            elif not p.get("is_active"):
-                status = " (out)"
-            lines.append(f"  Seat {p['seat']}: {p['name']} - {p['stack']} chips{status}")
-
-        if observation.actions_this_hand:
-            lines.append("")
-            lines.append("Actions this hand:")
-            for a in observation.actions_this_hand:
-                amount_str = f" {a['amount']}" if a.get('amount') else ""
-                lines.append(f"  {a['street']}: Seat {a['seat']} {a['action']}{amount_str}")
-
-        lines.append("")
-        lines.append(f"Amount to call: {observation.current_bet}")
-        if observation.min_raise > 0:
-            lines.append(f"Minimum raise to: {observation.min_raise}")
-        lines.append(f"Legal actions: {', '.join(observation.legal_actions)}")
-
-        return "\n".join(lines)
-
-    def _extract_json_from_markdown(self, text: str) -> str | None:
-        """Extract JSON content from markdown code blocks.
-        
-        Handles formats like:
-        - ```json\n{...}\n```
-        - ```\n{...}\n```
-        - ``` json\n{...}\n```
-        
-        Returns the content of the first code block containing valid JSON with "action",
-        or None if no such block is found.
-        """
-        # Pattern to match markdown code blocks with optional language tag
-        pattern = r'```\s*(?:json)?\s*\n?(.*?)\n?```'
-        matches = re.finditer(pattern, text, re.DOTALL | re.IGNORECASE)
-        
-        for match in matches:
-            content = match.group(1).strip()
-            # Check if this block contains JSON with "action" key
-            if '"action"' in content and '{' in content:
-                return content
-        
-        return None
+        obs = observation
+        # Optional sections carry their own leading newlines so they vanish cleanly
+        board = f"\nBoard: {' '.join(obs.community_cards)}" if obs.community_cards else ""
+        players = "".join(
+            f"\n  Seat {seat}: {name} - {stack} chips"
+            f"{' (folded)' if folded else '' if active else ' (out)'}"
+            for seat, name, stack, folded, active in zip(
+                obs.player_seats,
+                obs.player_names,
+                obs.player_stacks,
+                obs.player_folded,
+                obs.player_active,
+            )
+        )
+        actions = (
+            "\n\nActions this hand:" + "".join(
+                f"\n  {a['street']}: Seat {a['seat']} {a['action']}"
+                f"{' ' + str(a['amount']) if a.get('amount') else ''}"
+                for a in obs.actions_this_hand
+            )
+            if obs.actions_this_hand else ""
+        )
+        min_raise = f"\nMinimum raise to: {obs.min_raise}" if obs.min_raise > 0 else ""
+
+        return (
+            f"=== Hand #{obs.hand_number} - {obs.street.upper()} ===\n"
+            f"\n"
+            f"Your Position: {obs.my_position} (Seat {obs.my_seat})\n"
+            f"Your Cards: {obs.my_hole_cards[0]} {obs.my_hole_cards[1]}\n"
+            f"Your Stack: {obs.my_stack} chips ({obs.my_stack / obs.big_blind:.1f} BB)\n"
+            f"\n"
+            f"Blinds: {obs.small_blind}/{obs.big_blind}\n"
+            f"Pot: {obs.pot_size} chips{board}\n"
+            f"\n"
+            f"Players at table:{players}{actions}\n"
+            f"\n"
+            f"Amount to call: {obs.current_bet}{min_raise}\n"
+            f"Legal actions: {', '.join(obs.legal_actions)}"
+        )
 
     def _parse_action(self, response_text: str, observation: Observation) -> AgentAction | None:
         """Parse the LLM response into an action."""
+        # Every accepted response carries an "action" key; skip the parsing work otherwise
+        if '"action"' not in response_text:
+            return None
+
         # Try to extract JSON from the response
         try:
-            # First, try to extract JSON from markdown code blocks
-            markdown_json = self._extract_json_from_markdown(response_text)
-            
-            if markdown_json:
-                # Found JSON in a markdown block - try to parse it
-                json_match = re.search(r'\{[^{}]*"action"[^{}]*\}', markdown_json, re.DOTALL)
-                if json_match:
-                    data = json.loads(json_match.group())
-                else:
-                    data = json.loads(markdown_json)
-            else:
-                # No markdown block found, search in raw text
-                json_match = re.search(r'\{[^{}]*"action"[^{}]*\}', response_text, re.DOTALL)
-                if json_match:
-                    data = json.loads(json_match.group())
-                else:
-                    # Try parsing the whole response as JSON
-                    data = json.loads(response_text)
-
-            action = data.get("action", "").lower()
-            raise_to = data.get("raise_to")
+            # Bare or fenced JSON decodes in one go; the object scanner handles
+            # the action JSON embedded in prose
+            data = _load_strict_json(response_text) or _find_json_object(response_text)
+            if data is None:
+                # Try parsing the whole text as JSON
+                data = from_json(response_text)
+
+            raw_action = str(data.get("action", "")).strip().lower()
+            raise_to = _coerce_amount(data.get("raise_to"))
             reasoning = data.get("reasoning", "")
 
-            if action not in ["fold", "check", "call", "raise"]:
+            # Normalize near misses locally rather than spending a retry round-trip
+            action = _CANONICAL_ACTIONS.get(raw_action)
+            if action is None:
                 return None
+            if raw_action in _ALL_IN_ALIASES and raise_to is None:
+                raise_to = observation.max_raise
 
             if action == "raise" and raise_to is None:
-                return None
+                # Recover the amount from prose like "I'll raise to 600"
+                match = _RAISE_TO_RE.search(str(reasoning))
+                if match is None:
+                    return None
+                raise_to = _coerce_amount(match.group(1))
 
             return AgentAction(
                 action=action,
-                raise_to=int(raise_to) if raise_to is not None else None,
+                raise_to=raise_to,
                 reasoning=reasoning,
             )
-        except (json.JSONDecodeError, ValueError, TypeError):
+        except (ValueError, TypeError, OverflowError):
             return None
 
     def _validate_action(self, action: AgentAction, observation: Observation) -> tuple[bool, str]:
-        """Validate an action against the current game state."""
-        if action.action not in observation.legal_actions:
+        """Validate an action against the current game state.
+
+        Near-miss actions are normalized in place (see comments below), so
+        callers use the same `action` object after a successful check.
+        """
+        legal = observation.legal_action_set
+        # "call" with nothing to call is a check; fix it here instead of retrying
+        if (
+            action.action == "call"
+            and observation.current_bet == 0
+            and "call" not in legal
+            and "check" in legal
+        ):
+            action.action = "check"
+
+        if action.action not in legal:
             return False, f"Action '{action.action}' not in legal actions: {observation.legal_actions}"
 
         if action.action == "raise":
             if action.raise_to is None:
                 return False, "Raise action requires raise_to amount"
+            # Near-miss amounts are clamped rather than bounced back to the model:
+            # a little over the maximum means all-in, a little under the minimum
+            # snaps up when affordable. The clamp is noted in the reasoning.
+            requested = action.raise_to
+            if observation.max_raise < requested <= observation.max_raise * _RAISE_CLAMP_FACTOR:
+                action.raise_to = observation.max_raise
+            elif requested < observation.min_raise <= min(
+                observation.max_raise, requested * _RAISE_CLAMP_FACTOR
+            ):
+                action.raise_to = observation.min_raise
+            if action.raise_to != requested:
+                action.reasoning = (
+                    f"{action.reasoning} [raise_to {requested} clamped to {action.raise_to}]".lstrip()
+                )
             if action.raise_to < observation.min_raise and action.raise_to < observation.my_stack:
                 return False, f"Raise to {action.raise_to} below minimum {observation.min_raise}"
             if action.raise_to > observation.max_raise:
@@ -270,6 +654,52 @@ class LLMAgent(BaseAgent):
 
         return True, ""
 
+    def _pick_action(
+        self, response_texts: list[str | None], observation: Observation
+    ) -> tuple[AgentAction | None, str]:
+        """Pick the first valid action among sampled response texts.
+
+        Args:
+            response_texts: Candidate texts, primary choice first.
+            observation: Current game state.
+
+        Returns:
+            Tuple of (action, feedback). When no candidate is valid, action is
+            None and feedback is the follow-up message for the primary choice.
+        """
+        feedback = ""
+        for i, text in enumerate(response_texts):
+            if not text:
+                error = "Please provide your action decision in the required JSON format."
+            else:
+                action = self._parse_action(text, observation)
+                if action is None:
+                    error = "Invalid response format. Please respond with a JSON object containing 'action', 'raise_to' (if raising), and 'reasoning'."
+                else:
+                    is_valid, error_msg = self._validate_action(action, observation)
+                    if is_valid:
+                        return action, ""
+                    error = f"Invalid action: {error_msg}. Please choose a valid action."
+            if i == 0:
+                feedback = error
+        return None, feedback
+
+    def _should_offer_tools(self) -> bool:
+        """Whether to send tool definitions with this decision's LLM calls.
+
+        With adaptive tool turns enabled, agents that rarely use tools answer
+        in a single call without tool schemas. Tools are still offered every
+        few decisions so the average can recover if the agent starts using them.
+        """
+        if not self._adaptive_tools or self._avg_tools_used >= _TOOL_EMA_THRESHOLD:
+            self._decisions_since_tools = 0
+            return True
+        self._decisions_since_tools += 1
+        if self._decisions_since_tools >= _TOOL_PROBE_INTERVAL:
+            self._decisions_since_tools = 0
+            return True
+        return False
+
     def _tool_executor(self, tool_name: str, args: dict[str, Any]) -> dict[str, Any]:
         """Execute a tool call."""
         return execute_tool(tool_name, self.memory, args)
@@ -277,93 +707,156 @@ class LLMAgent(BaseAgent):
     def get_action(self, observation: Observation) -> AgentAction:
         """Get the agent's action using multi-turn LLM calls.
 
+        Synchronous wrapper around `aget_action`.
+
+        Args:
+            observation: Current game state.
+
+        Returns:
+            The agent's chosen action.
+        """
+        return run_sync(self.aget_action(observation))
+
+    async def aget_action(self, observation: Observation) -> AgentAction:
+        """Get the agent's action using multi-turn LLM calls.
+
         Args:
             observation: Current game state.
 
         Returns:
             The agent's chosen action.
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         trace = DecisionTrace(
-            observation=observation.to_dict(),
+            observation=observation,
             street=observation.street,
         )
 
-        # Build messages
-        messages = [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": self._build_observation_prompt(observation)},
+        # Nothing to decide: answer locally instead of spending an LLM round-trip
+        only_action = _only_sensible_action(observation)
+        if only_action is not None:
+            action = AgentAction(action=only_action, reasoning="Only sensible legal action")
+            action.thinking_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            trace.final_action = action.to_dict()
+            trace.thinking_time_ms = action.thinking_time_ms
+            self.decision_traces.append(trace)
+            return action
+
+        cache_key = near_key = None
+        cached = None
+        if self._decision_cache is not None:
+            cache_key = _decision_key(observation)
+            cached = self._decision_cache.get(cache_key)
+        if cached is None and self._near_match_cache is not None:
+            near_key = _near_match_key(observation)
+            near = self._near_match_cache.get(near_key)
+            if near is not None:
+                # Near-match raise sizes are stored in big blinds
+                raise_to = None if near[1] is None else round(near[1] * observation.big_blind)
+                cached = (near[0], raise_to, near[2])
+        if cached is not None:
+            action = AgentAction(action=cached[0], raise_to=cached[1], reasoning=cached[2])
+            if self._validate_action(action, observation)[0]:
+                action.thinking_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                trace.final_action = action.to_dict()
+                trace.thinking_time_ms = action.thinking_time_ms
+                trace.cached = True
+                self.decision_traces.append(trace)
+                return action
+
+        # The observation does not change between retries, so render it once;
+        # retries only add follow-up turns after this prefix
+        user_prompt = self._build_observation_prompt(observation)
+        base_messages = [
+            self._system_message,
+            {"role": "user", "content": user_prompt},
         ]
+        messages = base_messages
+        # The trace keeps every turn; the model only sees the latest failed attempt
+        trace.messages = list(base_messages)
+
+        # Every memory tool reads completed hands; with none recorded yet (or no
+        # seat, hence no memory) they can only return empty results or errors
+        offer_tools = (
+            self.seat is not None and bool(self.memory.hands) and self._should_offer_tools()
+        )
 
         retries = 0
         while retries <= self.max_retries:
             try:
                 # Make LLM call with tools
-                response, tool_calls = self.llm.call_with_tools(
+                response, tool_calls = await self.llm.acall_with_tools(
                     messages=messages,
-                    tools=TOOL_DEFINITIONS,
+                    tools=self._tools if offer_tools else [],
                     tool_executor=self._tool_executor,
-                    max_turns=5,
+                    max_turns=5 if offer_tools else 1,
+                    stop_when=_has_action_json,
                 )
 
+                if offer_tools:
+                    self._avg_tools_used = (
+                        _TOOL_EMA_DECAY * self._avg_tools_used
+                        + (1 - _TOOL_EMA_DECAY) * len(tool_calls)
+                    )
                 trace.tool_calls.extend(tool_calls)
-                trace.llm_responses.append({
+                llm_response: dict[str, Any] = {
                     "content": response.content,
                     "reasoning_content": response.reasoning_content,
                     "usage": response.usage,
                     "latency_ms": response.latency_ms,
-                })
+                }
+                if response.alternatives:
+                    llm_response["alternatives"] = response.alternatives
+                trace.llm_responses.append(llm_response)
 
                 # For thinking models, the response may be in reasoning_content instead of content
                 response_text = response.content or response.reasoning_content
 
-                if not response_text:
-                    retries += 1
-                    trace.retries = retries
-                    messages.append({
-                        "role": "user",
-                        "content": "Please provide your action decision in the required JSON format.",
-                    })
-                    continue
-
-                # Parse the action
-                action = self._parse_action(response_text, observation)
+                # Extra sampled choices (n_samples > 1) are tried before paying for a retry
+                action, feedback = self._pick_action(
+                    [response_text, *response.alternatives], observation
+                )
                 if action is None:
                     retries += 1
                     trace.retries = retries
-                    messages.append({
-                        "role": "assistant",
-                        "content": response_text,
-                    })
-                    messages.append({
+                    retry_tail = []
+                    if response_text:
+                        retry_tail.append({
+                            "role": "assistant",
+                            "content": response_text,
+                        })
+                    retry_tail.append({
                         "role": "user",
-                        "content": "Invalid response format. Please respond with a JSON object containing 'action', 'raise_to' (if raising), and 'reasoning'.",
-                    })
-                    continue
-
-                # Validate the action
-                is_valid, error_msg = self._validate_action(action, observation)
-                if not is_valid:
-                    retries += 1
-                    trace.retries = retries
-                    messages.append({
-                        "role": "assistant",
-                        "content": response_text,
-                    })
-                    messages.append({
-                        "role": "user",
-                        "content": f"Invalid action: {error_msg}. Please choose a valid action.",
+                        "content": feedback,
                     })
+                    trace.messages.extend(retry_tail)
+                    # Earlier failed attempts add prefill cost without helping the next try
+                    messages = base_messages + retry_tail
                     continue
 
                 # Valid action found
-                thinking_time_ms = (time.time() - start_time) * 1000
+                thinking_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
                 trace.final_action = action.to_dict()
                 trace.thinking_time_ms = thinking_time_ms
-                trace.messages = messages.copy()  # Capture final conversation state
                 action.thinking_time_ms = thinking_time_ms
                 action.retries = retries
                 self.decision_traces.append(trace)
+                if cache_key is not None:
+                    _cache_put(
+                        self._decision_cache,
+                        cache_key,
+                        (action.action, action.raise_to, action.reasoning),
+                    )
+                if near_key is not None:
+                    raise_to_bb = (
+                        None if action.raise_to is None
+                        else action.raise_to / (observation.big_blind or 1)
+                    )
+                    _cache_put(
+                        self._near_match_cache,
+                        near_key,
+                        (action.action, raise_to_bb, action.reasoning),
+                    )
                 return action
 
             except Exception as e:
@@ -372,12 +865,11 @@ class LLMAgent(BaseAgent):
                 trace.retries = retries
 
         # Max retries exceeded, force fold
-        thinking_time_ms = (time.time() - start_time) * 1000
+        thinking_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         trace.error = f"Max retries ({self.max_retries}) exceeded, forcing fold"
         trace.forced_fold = True
         trace.final_action = {"action": "fold", "raise_to": None, "reasoning": "Forced fold due to invalid actions"}
         trace.thinking_time_ms = thinking_time_ms
-        trace.messages = messages.copy()  # Capture final conversation state
         self.decision_traces.append(trace)
         return AgentAction(
             action="fold",
@@ -387,38 +879,19 @@ class LLMAgent(BaseAgent):
             thinking_time_ms=thinking_time_ms,
         )
 
-    def get_traces(self) -> list[dict[str, Any]]:
-        """Get all decision traces for logging."""
-        return [
-            {
-                "observation": t.observation,
-                "street": t.street,
-                "messages": t.messages,
-                "tool_calls": t.tool_calls,
-                "llm_responses": t.llm_responses,
-                "final_action": t.final_action,
-                "retries": t.retries,
-                "error": t.error,
-                "forced_fold": t.forced_fold,
-                "thinking_time_ms": t.thinking_time_ms,
-            }
-            for t in self.decision_traces
-        ]
+    def get_traces(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """Get decision traces for logging.
+
+        Args:
+            limit: Only return the most recent `limit` traces.
+        """
+        traces = self.decision_traces
+        if limit is not None:
+            traces = traces[max(len(traces) - limit, 0):]
+        return [t.to_dict() for t in traces]
 
     def get_last_trace(self) -> dict[str, Any] | None:
         """Get the most recent decision trace for immediate logging."""
         if not self.decision_traces:
             return None
-        t = self.decision_traces[-1]
-        return {
-            "observation": t.observation,
-            "street": t.street,
-            "messages": t.messages,
-            "tool_calls": t.tool_calls,
-            "llm_responses": t.llm_responses,
-            "final_action": t.final_action,
-            "retries": t.retries,
-            "error": t.error,
-            "forced_fold": t.forced_fold,
-            "thinking_time_ms": t.thinking_time_ms,
-        }
+        return self.decision_traces[-1].to_dict()
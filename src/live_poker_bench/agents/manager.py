@@ -1,10 +1,13 @@
 """Agent manager for coordinating poker agents."""
 
+import asyncio
 from typing import Any
 
 from live_poker_bench.agents.base import AgentAction, BaseAgent, Observation
 from live_poker_bench.agents.llm_agent import LLMAgent
 from live_poker_bench.agents.memory import AgentMemory, get_position_name
+from live_poker_bench.config import DEFAULT_MODEL
+from live_poker_bench.llm.adapter import run_sync
 
 
 class AgentManager:
@@ -15,6 +18,10 @@ class AgentManager:
         self.agents: dict[int, BaseAgent] = {}  # seat -> agent
         self.memories: dict[int, AgentMemory] = {}  # seat -> memory
         self.active_seats: list[int] = []
+        self._active_set: set[int] = set()  # Mirrors active_seats for O(1) membership
+        # (seat, memory) for each active seat, in active_seats order
+        self._active_memories: list[tuple[int, AgentMemory]] = []
+        self._llm_seats: set[int] = set()
         self.eliminated_seats: list[int] = []
 
     def add_agent(self, seat: int, agent: BaseAgent) -> None:
@@ -28,9 +35,13 @@ class AgentManager:
         if isinstance(agent, LLMAgent):
             agent.set_seat(seat)
             self.memories[seat] = agent.memory
+            self._llm_seats.add(seat)
         else:
             self.memories[seat] = AgentMemory(agent.name, seat)
+            self._llm_seats.discard(seat)
         self.active_seats.append(seat)
+        self._active_set.add(seat)
+        self._active_memories.append((seat, self.memories[seat]))
 
     def get_agent(self, seat: int) -> BaseAgent | None:
         """Get the agent at a seat."""
@@ -42,12 +53,16 @@ class AgentManager:
 
     def is_active(self, seat: int) -> bool:
         """Check if a seat is still active (not eliminated)."""
-        return seat in self.active_seats
+        return seat in self._active_set
 
     def eliminate_seat(self, seat: int) -> None:
         """Mark a seat as eliminated."""
-        if seat in self.active_seats:
+        if seat in self._active_set:
+            self._active_set.discard(seat)
             self.active_seats.remove(seat)
+            self._active_memories = [
+                entry for entry in self._active_memories if entry[0] != seat
+            ]
             self.eliminated_seats.append(seat)
 
     def get_active_seats(self) -> list[int]:
@@ -70,6 +85,59 @@ class AgentManager:
 
         return agent.get_action(observation)
 
+    async def aget_action(self, seat: int, observation: Observation) -> AgentAction:
+        """Async variant of `get_action`.
+
+        Args:
+            seat: The seat to get action from.
+            observation: The game state observation.
+
+        Returns:
+            The agent's action.
+        """
+        agent = self.agents.get(seat)
+        if agent is None:
+            raise ValueError(f"No agent at seat {seat}")
+
+        return await agent.aget_action(observation)
+
+    def get_actions_batch(
+        self, requests: list[tuple[int, Observation]]
+    ) -> list[AgentAction]:
+        """Get actions for several independent decisions at once.
+
+        Synchronous wrapper around `aget_actions_batch`.
+
+        Args:
+            requests: List of (seat, observation) pairs.
+
+        Returns:
+            The actions, in the same order as `requests`.
+        """
+        return run_sync(self.aget_actions_batch(requests))
+
+    async def aget_actions_batch(
+        self, requests: list[tuple[int, Observation]]
+    ) -> list[AgentAction]:
+        """Async variant of `get_actions_batch`.
+
+        The LLM calls for all requests are in flight together, so the batch
+        takes about as long as its slowest decision. Only use this for
+        decisions that do not depend on each other (e.g. different tables);
+        actions within one hand must still be requested in turn.
+
+        Args:
+            requests: List of (seat, observation) pairs.
+
+        Returns:
+            The actions, in the same order as `requests`.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.aget_action(seat, observation) for seat, observation in requests)
+            )
+        )
+
     def start_hand(
         self,
         hand_number: int,
@@ -83,12 +151,12 @@ class AgentManager:
             hole_cards: Dict mapping seat -> hole cards.
             button_seat: The button seat.
         """
-        for seat in self.active_seats:
-            memory = self.memories.get(seat)
+        num_players = len(self.agents)
+        for seat, memory in self._active_memories:
             cards = hole_cards.get(seat)
-            if memory and cards:
+            if cards:
                 position = get_position_name(
-                    seat, button_seat, len(self.agents), self.active_seats
+                    seat, button_seat, num_players, self.active_seats
                 )
                 memory.start_hand(hand_number, cards, position)
 
@@ -111,10 +179,8 @@ class AgentManager:
         if seat in self.agents:
             player_name = self.agents[seat].name
 
-        for active_seat in self.active_seats:
-            memory = self.memories.get(active_seat)
-            if memory:
-                memory.record_action(street, seat, player_name, action, amount)
+        for _, memory in self._active_memories:
+            memory.record_action(street, seat, player_name, action, amount)
 
     def update_community_cards(self, cards: tuple[str, ...]) -> None:
         """Update community cards for all active agents.
@@ -122,10 +188,8 @@ class AgentManager:
         Args:
             cards: The community cards.
         """
-        for seat in self.active_seats:
-            memory = self.memories.get(seat)
-            if memory:
-                memory.update_community_cards(cards)
+        for _, memory in self._active_memories:
+            memory.update_community_cards(cards)
 
     def record_showdown(self, seat: int, cards: tuple[str, str]) -> None:
         """Record showdown cards to all active agents' memories.
@@ -134,10 +198,8 @@ class AgentManager:
             seat: The seat showing cards.
             cards: The hole cards shown.
         """
-        for active_seat in self.active_seats:
-            memory = self.memories.get(active_seat)
-            if memory:
-                memory.record_showdown(seat, cards)
+        for _, memory in self._active_memories:
+            memory.record_showdown(seat, cards)
 
     def end_hand(
         self,
@@ -150,29 +212,28 @@ class AgentManager:
             results: Dict mapping seat -> {result, chips_won, final_stack}.
             pot_size: Final pot size.
         """
-        for seat in self.active_seats:
-            memory = self.memories.get(seat)
+        for seat, memory in self._active_memories:
             result_data = results.get(seat, {})
-            if memory:
-                memory.end_hand(
-                    result=result_data.get("result", "folded"),
-                    chips_won=result_data.get("chips_won", 0),
-                    pot_size=pot_size,
-                    final_stack=result_data.get("final_stack", 0),
-                )
+            memory.end_hand(
+                result=result_data.get("result", "folded"),
+                chips_won=result_data.get("chips_won", 0),
+                pot_size=pot_size,
+                final_stack=result_data.get("final_stack", 0),
+            )
 
     def reset_for_tournament(self) -> None:
         """Reset all agents for a new tournament."""
         self.active_seats = list(self.agents.keys())
+        self._active_set = set(self.active_seats)
         self.eliminated_seats = []
         for agent in self.agents.values():
             agent.reset()
-        for seat in self.agents:
-            agent = self.agents[seat]
-            if isinstance(agent, LLMAgent):
+        for seat, agent in self.agents.items():
+            if seat in self._llm_seats:
                 self.memories[seat] = agent.memory
             else:
                 self.memories[seat] = AgentMemory(agent.name, seat)
+        self._active_memories = [(seat, self.memories[seat]) for seat in self.active_seats]
 
     def get_agent_traces(self, seat: int) -> list[dict[str, Any]]:
         """Get decision traces for an agent (if it's an LLM agent).
@@ -183,9 +244,8 @@ class AgentManager:
         Returns:
             List of decision traces.
         """
-        agent = self.agents.get(seat)
-        if isinstance(agent, LLMAgent):
-            return agent.get_traces()
+        if seat in self._llm_seats:
+            return self.agents[seat].get_traces()
         return []
 
     def get_last_trace(self, seat: int) -> dict[str, Any] | None:
@@ -197,9 +257,8 @@ class AgentManager:
         Returns:
             The last decision trace, or None if not available.
         """
-        agent = self.agents.get(seat)
-        if isinstance(agent, LLMAgent):
-            return agent.get_last_trace()
+        if seat in self._llm_seats:
+            return self.agents[seat].get_last_trace()
         return None
 
     @classmethod
@@ -224,7 +283,7 @@ class AgentManager:
         for i, config in enumerate(agent_configs):
             seat = i + 1
             name = config.get("name", f"Agent_{seat}")
-            model = config.get("model", "openrouter/openai/gpt-4o")
+            model = config.get("model", DEFAULT_MODEL)
 
             # Per-agent reasoning overrides global reasoning
             agent_reasoning = config.get("reasoning")
@@ -240,6 +299,22 @@ class AgentManager:
                 max_retries=config.get("max_retries", global_settings.get("max_retries", 3)),
                 reasoning=reasoning,
                 provider=provider,
+                n_samples=config.get("n_samples", global_settings.get("n_samples", 1)),
+                stream=config.get("stream", global_settings.get("stream", False)),
+                config={
+                    "enable_decision_cache": config.get(
+                        "enable_decision_cache",
+                        global_settings.get("enable_decision_cache", False),
+                    ),
+                    "enable_near_match_cache": config.get(
+                        "enable_near_match_cache",
+                        global_settings.get("enable_near_match_cache", False),
+                    ),
+                    "adaptive_tool_turns": config.get(
+                        "adaptive_tool_turns",
+                        global_settings.get("adaptive_tool_turns", False),
+                    ),
+                },
             )
             manager.add_agent(seat, agent)
 
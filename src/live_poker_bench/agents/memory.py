@@ -1,10 +1,25 @@
 """Agent memory system for storing observable game information."""
 
+import functools
+import sys
+from array import array
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from typing import Literal
+from itertools import islice
+from typing import Any, Literal
 
+from live_poker_bench.engine.deck import RANKS, SUITS
 
-@dataclass
+_WON = sys.intern("won")
+# Lowercased card string -> card id (rank * 4 + suit, 0-51)
+_CARD_IDS = {
+    f"{rank}{suit}".lower(): rank_idx * 4 + suit_idx
+    for rank_idx, rank in enumerate(RANKS)
+    for suit_idx, suit in enumerate(SUITS)
+}
+
+
+@dataclass(slots=True)
 class ActionRecord:
     """A single action observed during play."""
 
@@ -14,8 +29,40 @@ class ActionRecord:
     action: str
     amount: int | None = None
 
+    # Lowercased copies for case-insensitive filtering, computed once
+    street_lc: str = field(init=False, repr=False, compare=False)
+    player_name_lc: str = field(init=False, repr=False, compare=False)
+    action_lc: str = field(init=False, repr=False, compare=False)
+
+    # Memoized to_dict() result; actions do not change once recorded
+    _dict: dict[str, Any] | None = field(init=False, default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Streets and actions come from a tiny vocabulary: intern them so
+        # thousands of records share one string each and compare by identity
+        self.street = sys.intern(self.street)
+        self.action = sys.intern(self.action)
+        self.street_lc = sys.intern(self.street.lower())
+        self.player_name_lc = self.player_name.lower()
+        self.action_lc = sys.intern(self.action.lower())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization.
 
-@dataclass
+        The result is built once and shared between calls; treat it as read-only.
+        """
+        if self._dict is None:
+            self._dict = {
+                "street": self.street,
+                "seat": self.seat,
+                "player_name": self.player_name,
+                "action": self.action,
+                "amount": self.amount,
+            }
+        return self._dict
+
+
+@dataclass(slots=True)
 class HandRecord:
     """Record of a hand from an agent's perspective."""
 
@@ -30,13 +77,109 @@ class HandRecord:
     pot_size: int = 0
     my_final_stack: int = 0
 
+    # Lowercased copies for case-insensitive filtering; result_lc is refreshed by end_hand
+    position_lc: str = field(init=False, repr=False, compare=False)
+    result_lc: str = field(init=False, repr=False, compare=False)
+
+    # Memoized to_dict() result, built once the hand is finished
+    _dict: dict[str, Any] | None = field(init=False, default=None, repr=False, compare=False)
+
+    # Lazily built search index: bigram signature and lowercased searchable text
+    _search_sig: int | None = field(default=None, init=False, repr=False, compare=False)
+    _search_blob: str = field(default="", init=False, repr=False, compare=False)
+    # Bit per card id for the hole and community cards, built with the search index
+    _card_mask: int = field(default=0, init=False, repr=False, compare=False)
+    # Lazily built groupings of `actions`, and how many actions they cover
+    _actions_by_seat: dict[int, list[ActionRecord]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _actions_by_street: dict[str, list[ActionRecord]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _grouped_count: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.my_position = sys.intern(self.my_position)
+        self.result = sys.intern(self.result)
+        self.position_lc = sys.intern(self.my_position.lower())
+        self.result_lc = sys.intern(self.result.lower())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization.
+
+        Like `search_index`, only call this once the hand is finished: the
+        result is built once and shared between calls; treat it as read-only.
+        """
+        if self._dict is None:
+            self._dict = {
+                "hand_number": self.hand_number,
+                "my_position": self.my_position,
+                "my_hole_cards": self.my_hole_cards,
+                "community_cards": self.community_cards,
+                "actions": [a.to_dict() for a in self.actions],
+                "showdown_cards": {str(k): v for k, v in self.showdown_cards.items()},
+                "result": self.result,
+                "chips_won": self.chips_won,
+                "pot_size": self.pot_size,
+                "my_final_stack": self.my_final_stack,
+            }
+        return self._dict
+
+    def search_index(self) -> tuple[int, str, int]:
+        """Get the (signature, text, card mask) used by `AgentMemory.search_observations`.
+
+        Built on first use; only call this once the hand is finished.
+        """
+        if self._search_sig is None:
+            cards = [*self.my_hole_cards, *self.community_cards]
+            fields = [*cards, self.my_position, self.result]
+            for a in self.actions:
+                fields.append(a.action)
+                fields.append(a.player_name)
+            # The separator keeps a query from matching across two fields
+            self._search_blob = "\x00".join(fields).lower()
+            self._search_sig = _bigram_signature(self._search_blob)
+            for card in cards:
+                card_id = _CARD_IDS.get(card.lower())
+                if card_id is not None:
+                    self._card_mask |= 1 << card_id
+        return self._search_sig, self._search_blob, self._card_mask
+
+    def _group_actions(self) -> None:
+        """Group actions by seat and by street, once per change to `actions`."""
+        if self._grouped_count == len(self.actions):
+            return
+        by_seat: dict[int, list[ActionRecord]] = {}
+        by_street: dict[str, list[ActionRecord]] = {}
+        for a in self.actions:
+            by_seat.setdefault(a.seat, []).append(a)
+            by_street.setdefault(a.street, []).append(a)
+        self._actions_by_seat = by_seat
+        self._actions_by_street = by_street
+        self._grouped_count = len(self.actions)
+
     def get_opponent_actions(self, opponent_seat: int) -> list[ActionRecord]:
         """Get all actions by a specific opponent in this hand."""
-        return [a for a in self.actions if a.seat == opponent_seat]
+        self._group_actions()
+        return list(self._actions_by_seat.get(opponent_seat, ()))
 
     def get_actions_by_street(self, street: str) -> list[ActionRecord]:
         """Get all actions on a specific street."""
-        return [a for a in self.actions if a.street == street]
+        self._group_actions()
+        return list(self._actions_by_street.get(street, ()))
+
+
+def _bigram_signature(text: str) -> int:
+    """Fold every 2-character window of text into a 64-bit mask.
+
+    If a query is a substring of some text, every bit of the query's
+    signature is also set in the text's signature, so a missing bit rules
+    the text out without a substring search.
+    """
+    sig = 0
+    for i in range(len(text) - 1):
+        sig |= 1 << ((ord(text[i]) * 31 + ord(text[i + 1])) & 63)
+    return sig
 
 
 def get_position_name(seat: int, button_seat: int, num_players: int, active_seats: list[int]) -> str:
@@ -51,23 +194,31 @@ def get_position_name(seat: int, button_seat: int, num_players: int, active_seat
     Returns:
         Position name (BTN, SB, BB, UTG, MP, CO, etc.)
     """
-    if seat not in active_seats:
-        return "OUT"
+    return _position_table(tuple(active_seats), button_seat).get(seat, "OUT")
+
 
+@functools.lru_cache(maxsize=256)
+def _position_table(active_seats: tuple[int, ...], button_seat: int) -> dict[int, str]:
+    """Map every active seat to its position name for one table configuration.
+
+    Cached: a table only goes through a handful of (seats, button) combinations.
+    The returned dict is shared, so callers must not modify it.
+    """
     # Sort seats and find position relative to button
     sorted_seats = sorted(active_seats)
     n = len(sorted_seats)
 
-    if n == 0:
-        return "OUT"
-
     # Find button index
     btn_idx = sorted_seats.index(button_seat) if button_seat in sorted_seats else 0
-    seat_idx = sorted_seats.index(seat)
 
-    # Position relative to button (0 = button)
-    relative_pos = (seat_idx - btn_idx) % n
+    return {
+        seat: _relative_position_name((seat_idx - btn_idx) % n, n)
+        for seat_idx, seat in enumerate(sorted_seats)
+    }
 
+
+def _relative_position_name(relative_pos: int, n: int) -> str:
+    """Name the position `relative_pos` seats after the button at an n-handed table."""
     if relative_pos == 0:
         return "BTN"
     elif relative_pos == 1:
@@ -104,7 +255,30 @@ class AgentMemory:
         self.agent_name = agent_name
         self.seat = seat
         self.hands: list[HandRecord] = []
+        self.result_counts: Counter[str] = Counter()  # result -> number of finished hands
+        self._hand_by_number: dict[int, HandRecord] = {}
+        # Search signature of each finished hand, parallel to `hands`
+        self._hand_sigs = array("Q")
         self._current_hand: HandRecord | None = None
+        # seat -> finished hands where that seat's cards were revealed
+        self._showdowns_by_seat: defaultdict[int, list[HandRecord]] = defaultdict(list)
+
+        # Columnar table of the actions of finished hands, in the order they
+        # were played. Text columns hold codes from `_vocab` (lowercased text -> code).
+        self._action_records: list[ActionRecord] = []
+        self._col_hand = array("l")
+        self._col_seat = array("i")
+        self._col_street = array("I")
+        self._col_type = array("I")
+        self._col_name = array("I")
+        self._vocab: dict[str, int] = {}
+        # Row positions per column value, for picking a small starting set
+        self._rows_by_seat: defaultdict[int, array] = defaultdict(lambda: array("I"))
+        self._rows_by_street: defaultdict[int, array] = defaultdict(lambda: array("I"))
+        self._rows_by_type: defaultdict[int, array] = defaultdict(lambda: array("I"))
+        self._rows_by_name: defaultdict[int, array] = defaultdict(lambda: array("I"))
+        # Rows of every action not taken by this agent
+        self._opponent_rows = array("I")
 
     def start_hand(
         self,
@@ -191,19 +365,123 @@ class AgentMemory:
             final_stack: Agent's stack after the hand.
         """
         if self._current_hand is not None:
-            self._current_hand.result = result
+            self._current_hand.result = sys.intern(result)
+            self._current_hand.result_lc = sys.intern(result.lower())
             self._current_hand.chips_won = chips_won
             self._current_hand.pot_size = pot_size
             self._current_hand.my_final_stack = final_stack
             self.hands.append(self._current_hand)
+            # Like a scan of `hands`, a repeated hand number resolves to the earliest hand
+            self._hand_by_number.setdefault(self._current_hand.hand_number, self._current_hand)
+            self._hand_sigs.append(self._current_hand.search_index()[0])
+            self.result_counts[self._current_hand.result] += 1
+            for seat in self._current_hand.showdown_cards:
+                self._showdowns_by_seat[seat].append(self._current_hand)
+            self._index_actions(self._current_hand)
             self._current_hand = None
 
+    def _index_actions(self, hand: HandRecord) -> None:
+        """Append a finished hand's actions to the action table."""
+        vocab = self._vocab
+        for action in hand.actions:
+            row = len(self._action_records)
+            street = vocab.setdefault(action.street_lc, len(vocab))
+            action_type = vocab.setdefault(action.action_lc, len(vocab))
+            name = vocab.setdefault(action.player_name_lc, len(vocab))
+
+            self._action_records.append(action)
+            self._col_hand.append(hand.hand_number)
+            self._col_seat.append(action.seat)
+            self._col_street.append(street)
+            self._col_type.append(action_type)
+            self._col_name.append(name)
+
+            self._rows_by_seat[action.seat].append(row)
+            self._rows_by_street[street].append(row)
+            self._rows_by_type[action_type].append(row)
+            self._rows_by_name[name].append(row)
+            if action.seat != self.seat:
+                self._opponent_rows.append(row)
+
+    def find_actions(
+        self,
+        seat: int | None = None,
+        player_name: str | None = None,
+        street: str | None = None,
+        action_type: str | None = None,
+        exclude_seat: int | None = None,
+        last: int | None = None,
+    ) -> list[tuple[int, ActionRecord]]:
+        """Find actions from finished hands matching all given filters.
+
+        Text filters are case-insensitive. Starts from the smallest set of
+        rows among the filters given and checks the rest on the columns.
+        With `last`, rows are checked newest first and the scan stops as
+        soon as enough matches are found.
+
+        Args:
+            seat: Only actions by this seat.
+            player_name: Only actions by this player.
+            street: Only actions on this street.
+            action_type: Only actions of this type.
+            exclude_seat: Skip actions by this seat.
+            last: Only return the most recent `last` matches; zero or less
+                returns nothing.
+
+        Returns:
+            List of (hand_number, action) pairs, oldest first.
+        """
+        if last is not None and last <= 0:
+            return []
+        vocab = self._vocab
+        name_code = street_code = type_code = None
+        candidates: list[array] = []
+        if seat is not None:
+            candidates.append(self._rows_by_seat.get(seat, array("I")))
+        if player_name is not None:
+            name_code = vocab.get(player_name.lower())
+            if name_code is None:
+                return []
+            candidates.append(self._rows_by_name[name_code])
+        if street is not None:
+            street_code = vocab.get(street.lower())
+            if street_code is None:
+                return []
+            candidates.append(self._rows_by_street[street_code])
+        if action_type is not None:
+            type_code = vocab.get(action_type.lower())
+            if type_code is None:
+                return []
+            candidates.append(self._rows_by_type[type_code])
+        if candidates:
+            rows = min(candidates, key=len)
+        elif exclude_seat is not None and exclude_seat == self.seat:
+            # Opponent actions are kept apart, so the exclusion is already applied
+            rows = self._opponent_rows
+            exclude_seat = None
+        else:
+            rows = range(len(self._action_records))
+
+        seats, streets, types, names = self._col_seat, self._col_street, self._col_type, self._col_name
+        if len(candidates) > 1 or exclude_seat is not None:
+            matching = (
+                i
+                for i in (reversed(rows) if last is not None else rows)
+                if (seat is None or seats[i] == seat)
+                and seats[i] != exclude_seat
+                and (name_code is None or names[i] == name_code)
+                and (street_code is None or streets[i] == street_code)
+                and (type_code is None or types[i] == type_code)
+            )
+            rows = list(islice(matching, last))[::-1] if last is not None else list(matching)
+        elif last is not None:
+            rows = rows[-last:]
+        hands, records = self._col_hand, self._action_records
+        return [(hands[i], records[i]) for i in rows]
+
     def get_hand(self, hand_number: int) -> HandRecord | None:
         """Get a specific hand record by number."""
-        for hand in self.hands:
-            if hand.hand_number == hand_number:
-                return hand
-        return None
+        return self._hand_by_number.get(hand_number)
 
     def get_hands_against(self, opponent_seat: int) -> list[HandRecord]:
         """Get all hands where a specific opponent was involved."""
@@ -215,11 +493,11 @@ class AgentMemory:
 
     def get_showdowns_by_opponent(self, opponent_seat: int) -> list[HandRecord]:
         """Get all hands where an opponent's cards were revealed."""
-        return [h for h in self.hands if opponent_seat in h.showdown_cards]
+        return list(self._showdowns_by_seat.get(opponent_seat, ()))
 
     def get_winning_hands(self) -> list[HandRecord]:
         """Get all hands the agent won."""
-        return [h for h in self.hands if h.result == "won"]
+        return [h for h in self.hands if h.result == _WON]
 
     def get_recent_hands(self, n: int = 10) -> list[HandRecord]:
         """Get the N most recent hands."""
@@ -228,7 +506,9 @@ class AgentMemory:
     def search_observations(self, query: str) -> list[HandRecord]:
         """Search hands for matching observations.
 
-        Simple text search across hand data.
+        Simple case-insensitive substring search across cards, position,
+        result, and each action and player name. A multi-word query matches
+        hands containing every word, in any of those fields.
 
         Args:
             query: Search query string.
@@ -236,33 +516,24 @@ class AgentMemory:
         Returns:
             List of matching HandRecords.
         """
-        query = query.lower()
+        terms = query.lower().split() or [query.lower()]
+        query_sig = 0
+        for term in terms:
+            query_sig |= _bigram_signature(term)
+        # Terms naming a card are satisfied by a single bit test when the hand
+        # holds or saw that card; otherwise they fall back to the text search
+        card_bits = [1 << _CARD_IDS[term] if term in _CARD_IDS else 0 for term in terms]
         results = []
 
-        for hand in self.hands:
-            # Search in cards
-            if any(query in c.lower() for c in hand.my_hole_cards):
-                results.append(hand)
+        for hand_sig, hand in zip(self._hand_sigs, self.hands):
+            # Cheap prefilter: skip hands missing any of the query's bigrams
+            if query_sig & hand_sig != query_sig:
                 continue
-            if any(query in c.lower() for c in hand.community_cards):
+            _, blob, card_mask = hand.search_index()
+            if all(
+                card_mask & bit or term in blob for term, bit in zip(terms, card_bits)
+            ):
                 results.append(hand)
-                continue
-
-            # Search in position
-            if query in hand.my_position.lower():
-                results.append(hand)
-                continue
-
-            # Search in result
-            if query in hand.result.lower():
-                results.append(hand)
-                continue
-
-            # Search in actions
-            for action in hand.actions:
-                if query in action.action.lower() or query in action.player_name.lower():
-                    results.append(hand)
-                    break
 
         return results
 
@@ -271,30 +542,5 @@ class AgentMemory:
         return {
             "agent_name": self.agent_name,
             "seat": self.seat,
-            "hands": [
-                {
-                    "hand_number": h.hand_number,
-                    "my_position": h.my_position,
-                    "my_hole_cards": h.my_hole_cards,
-                    "community_cards": h.community_cards,
-                    "actions": [
-                        {
-                            "street": a.street,
-                            "seat": a.seat,
-                            "player_name": a.player_name,
-                            "action": a.action,
-                            "amount": a.amount,
-                        }
-                        for a in h.actions
-                    ],
-                    "showdown_cards": {
-                        str(k): v for k, v in h.showdown_cards.items()
-                    },
-                    "result": h.result,
-                    "chips_won": h.chips_won,
-                    "pot_size": h.pot_size,
-                    "my_final_stack": h.my_final_stack,
-                }
-                for h in self.hands
-            ],
+            "hands": [h.to_dict() for h in self.hands],
         }
@@ -1,10 +1,16 @@
 """Observation builder for creating agent prompts."""
 
-from dataclasses import dataclass
+import io
+from dataclasses import dataclass, field
 from typing import Any
 
 from live_poker_bench.agents.base import Observation
 
+# Section header per street in the action history
+_STREET_HEADERS = {
+    street: f"  {street.upper()}:\n" for street in ("preflop", "flop", "turn", "river")
+}
+
 
 @dataclass
 class FormattedObservation:
@@ -13,6 +19,15 @@ class FormattedObservation:
     observation: Observation
     use_bb_notation: bool = True
 
+    # Divisor for BB notation, resolved once; stacks stay in chips when there is no big blind
+    _bb_divisor: int = field(init=False, repr=False, compare=False)
+    # Memoized to_prompt() result; observations do not change once built
+    _prompt: str | None = field(init=False, default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        bb = self.observation.big_blind
+        self._bb_divisor = bb if bb > 0 else 1
+
     def format_stack(self, chips: int) -> str:
         """Format stack size, optionally in BB notation.
 
@@ -23,9 +38,7 @@ class FormattedObservation:
             Formatted string.
         """
         if self.use_bb_notation:
-            bb = self.observation.big_blind
-            bbs = chips / bb if bb > 0 else chips
-            return f"{bbs:.1f}BB ({chips} chips)"
+            return f"{chips / self._bb_divisor:.1f}BB ({chips} chips)"
         return f"{chips} chips"
 
     def format_pot(self) -> str:
@@ -46,78 +59,84 @@ class FormattedObservation:
 
     def format_players(self) -> str:
         """Format player information."""
-        lines = []
-        for p in self.observation.players:
-            status = "folded" if p["is_folded"] else "active"
-            stack = self.format_stack(p["stack"])
-            lines.append(f"  Seat {p['seat']}: {p['name']} - {stack} ({status})")
-        return "\n".join(lines)
+        obs = self.observation
+        return "\n".join(
+            f"  Seat {seat}: {name} - {self.format_stack(stack)} ({'folded' if folded else 'active'})"
+            for seat, name, stack, folded in zip(
+                obs.player_seats, obs.player_names, obs.player_stacks, obs.player_folded
+            )
+        )
 
     def format_actions(self) -> str:
         """Format action history this hand."""
         if not self.observation.actions_this_hand:
             return "  No actions yet"
 
-        lines = []
+        buf = io.StringIO()
         current_street = None
         for a in self.observation.actions_this_hand:
-            if a["street"] != current_street:
-                current_street = a["street"]
-                lines.append(f"  {current_street.upper()}:")
+            street = a["street"]
+            if street != current_street:
+                current_street = street
+                header = _STREET_HEADERS.get(street)
+                buf.write(header if header is not None else f"  {street.upper()}:\n")
 
-            action_str = a["action"]
-            if a.get("amount"):
-                action_str += f" {a['amount']}"
-            lines.append(f"    Seat {a['seat']}: {action_str}")
+            amount = a.get("amount")
+            if amount:
+                buf.write(f"    Seat {a['seat']}: {a['action']} {amount}\n")
+            else:
+                buf.write(f"    Seat {a['seat']}: {a['action']}\n")
 
-        return "\n".join(lines)
+        # Drop the final newline
+        return buf.getvalue()[:-1]
 
     def to_prompt(self) -> str:
         """Generate the full observation prompt for the LLM.
 
+        The prompt is built on the first call and reused afterwards.
+
         Returns:
             Formatted string for LLM consumption.
         """
+        if self._prompt is None:
+            self._prompt = self._build_prompt()
+        return self._prompt
+
+    def _build_prompt(self) -> str:
+        """Render the prompt returned by `to_prompt`."""
         obs = self.observation
+        community = " ".join(obs.community_cards) if obs.community_cards else "None"
+        raise_range = (
+            f"\n  Raise range: {self.format_raise_range()}" if "raise" in obs.legal_actions else ""
+        )
+
+        return f"""=== POKER DECISION - Hand #{obs.hand_number} ===
+
+YOUR INFORMATION:
+  Seat: {obs.my_seat}
+  Position: {obs.my_position}
+  Hole Cards: {obs.my_hole_cards[0]} {obs.my_hole_cards[1]}
+  Stack: {self.format_stack(obs.my_stack)}
+
+GAME STATE:
+  Street: {obs.street}
+  Community Cards: {community}
+  Pot: {self.format_pot()}
+  To Call: {self.format_bet()}
+
+BLINDS: {obs.small_blind}/{obs.big_blind}
+Button: Seat {obs.button_seat}
+
+PLAYERS:
+{self.format_players()}
+
+ACTION HISTORY THIS HAND:
+{self.format_actions()}
+
+LEGAL ACTIONS:
+  {", ".join(obs.legal_actions)}{raise_range}
 
-        # Build the prompt
-        lines = [
-            f"=== POKER DECISION - Hand #{obs.hand_number} ===",
-            "",
-            "YOUR INFORMATION:",
-            f"  Seat: {obs.my_seat}",
-            f"  Position: {obs.my_position}",
-            f"  Hole Cards: {obs.my_hole_cards[0]} {obs.my_hole_cards[1]}",
-            f"  Stack: {self.format_stack(obs.my_stack)}",
-            "",
-            "GAME STATE:",
-            f"  Street: {obs.street}",
-            f"  Community Cards: {' '.join(obs.community_cards) if obs.community_cards else 'None'}",
-            f"  Pot: {self.format_pot()}",
-            f"  To Call: {self.format_bet()}",
-            "",
-            f"BLINDS: {obs.small_blind}/{obs.big_blind}",
-            f"Button: Seat {obs.button_seat}",
-            "",
-            "PLAYERS:",
-            self.format_players(),
-            "",
-            "ACTION HISTORY THIS HAND:",
-            self.format_actions(),
-            "",
-            "LEGAL ACTIONS:",
-            f"  {', '.join(obs.legal_actions)}",
-        ]
-
-        if "raise" in obs.legal_actions:
-            lines.append(f"  Raise range: {self.format_raise_range()}")
-
-        lines.extend([
-            "",
-            "=== MAKE YOUR DECISION ===",
-        ])
-
-        return "\n".join(lines)
+=== MAKE YOUR DECISION ==="""
 
 
 class ObservationBuilder:
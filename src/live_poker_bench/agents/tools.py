@@ -3,7 +3,8 @@
 These are the only tools agents can use to query their memory.
 """
 
-from typing import Any
+from itertools import islice
+from typing import Any, Callable
 
 from live_poker_bench.agents.memory import AgentMemory, HandRecord
 
@@ -54,31 +55,20 @@ def recall_opponent_actions(
     Returns:
         Dictionary with opponent action history.
     """
-    actions = []
-
-    for hand in memory.hands:
-        for action in hand.actions:
-            # Skip own actions
-            if action.seat == memory.seat:
-                continue
-
-            # Apply filters
-            if opponent_seat is not None and action.seat != opponent_seat:
-                continue
-            if opponent_name is not None and action.player_name.lower() != opponent_name.lower():
-                continue
-            if street is not None and action.street.lower() != street.lower():
-                continue
-            if action_type is not None and action.action.lower() != action_type.lower():
-                continue
-
-            actions.append({
-                "hand_number": hand.hand_number,
-                **_format_action(action),
-            })
+    matches = memory.find_actions(
+        seat=opponent_seat,
+        player_name=opponent_name,
+        street=street,
+        action_type=action_type,
+        exclude_seat=memory.seat,  # Skip own actions
+        last=limit if limit > 0 else None,  # Scan back from the most recent action
+    )
 
     # Get most recent actions first
-    actions = actions[-limit:]
+    actions = [
+        {"hand_number": hand_number, **_format_action(action)}
+        for hand_number, action in matches[-limit:]
+    ]
 
     # Also include showdown info for this opponent
     showdowns = []
@@ -116,21 +106,27 @@ def recall_my_hands(
     Returns:
         Dictionary with agent's hand history.
     """
-    hands = memory.hands.copy()
-
-    # Apply filters
     if result is not None:
-        hands = [h for h in hands if h.result.lower() == result.lower()]
+        result = result.lower()
     if position is not None:
-        hands = [h for h in hands if h.my_position.lower() == position.lower()]
-
-    # Get most recent hands
-    hands = hands[-limit:]
+        position = position.lower()
+
+    # Walk back from the most recent hand, stopping once `limit` are found
+    matching = (
+        h
+        for h in reversed(memory.hands)
+        if (result is None or h.result_lc == result)
+        and (position is None or h.position_lc == position)
+    )
+    if limit > 0:
+        hands = list(islice(matching, limit))[::-1]
+    else:
+        hands = list(matching)[::-1][-limit:]
 
     # Calculate stats
     total_hands = len(memory.hands)
-    wins = len([h for h in memory.hands if h.result == "won"])
-    folds = len([h for h in memory.hands if h.result == "folded"])
+    wins = memory.result_counts["won"]
+    folds = memory.result_counts["folded"]
 
     return {
         "total_hands_played": total_hands,
@@ -270,6 +266,13 @@ TOOL_DEFINITIONS = [
     },
 ]
 
+# Tool name -> implementation, for execute_tool
+_TOOL_DISPATCH: dict[str, Callable[..., dict[str, Any]]] = {
+    "recall_opponent_actions": recall_opponent_actions,
+    "recall_my_hands": recall_my_hands,
+    "search_observations": search_observations,
+}
+
 
 def execute_tool(
     tool_name: str,
@@ -289,11 +292,7 @@ def execute_tool(
     Raises:
         ValueError: If tool name is unknown.
     """
-    if tool_name == "recall_opponent_actions":
-        return recall_opponent_actions(memory, **arguments)
-    elif tool_name == "recall_my_hands":
-        return recall_my_hands(memory, **arguments)
-    elif tool_name == "search_observations":
-        return search_observations(memory, **arguments)
-    else:
+    tool = _TOOL_DISPATCH.get(tool_name)
+    if tool is None:
         raise ValueError(f"Unknown tool: {tool_name}")
+    return tool(memory, **arguments)
@@ -1,13 +1,38 @@
 """Configuration loading and validation using Pydantic."""
 
-import json
+import functools
+import os
+import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
 
 
-class BlindLevelConfig(BaseModel):
+# Model used when an agent config doesn't name one; interned so identity
+# checks and dict lookups against it stay cheap wherever it is passed around
+DEFAULT_MODEL = sys.intern("openrouter/openai/gpt-4o")
+
+
+class _ConfigModel(BaseModel):
+    """Base for config models: immutable once validated.
+
+    Loaded configs are cached and shared (see `load_config`), so they are
+    frozen rather than copied defensively.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
+class BlindLevelConfig(_ConfigModel):
     """Configuration for a single blind level."""
 
     hands: int | None = None  # None means infinite (final level)
@@ -15,35 +40,82 @@ class BlindLevelConfig(BaseModel):
     bb: int
 
 
-class TournamentConfig(BaseModel):
+# The defaults are known to be valid, so they are built without validation
+_DEFAULT_BLIND_SCHEDULE = tuple(
+    BlindLevelConfig.model_construct(hands=hands, sb=sb, bb=bb)
+    for hands, sb, bb in (
+        (20, 1, 2),
+        (20, 2, 4),
+        (20, 4, 8),
+        (20, 8, 16),
+        (20, 16, 32),
+        (None, 32, 64),
+    )
+)
+
+
+class BlindScheduleArrays(NamedTuple):
+    """Blind schedule as parallel tuples, one entry per level."""
+
+    hands: tuple[int | None, ...]
+    sb: tuple[int, ...]
+    bb: tuple[int, ...]
+
+
+class TournamentConfig(_ConfigModel):
     """Tournament configuration."""
 
     num_runs: int = Field(default=10, ge=1, description="Number of tournament runs")
     seats: int = Field(default=6, ge=2, le=8, description="Number of players")
     starting_stack: int = Field(default=200, ge=1, description="Starting chips per player")
+    # Levels are immutable, so every default schedule shares the same ones.
+    # Emptiness is a declarative constraint, checked inside pydantic-core.
     blind_schedule: list[BlindLevelConfig] = Field(
-        default_factory=lambda: [
-            BlindLevelConfig(hands=20, sb=1, bb=2),
-            BlindLevelConfig(hands=20, sb=2, bb=4),
-            BlindLevelConfig(hands=20, sb=4, bb=8),
-            BlindLevelConfig(hands=20, sb=8, bb=16),
-            BlindLevelConfig(hands=20, sb=16, bb=32),
-            BlindLevelConfig(hands=None, sb=32, bb=64),
-        ]
+        default_factory=lambda: list(_DEFAULT_BLIND_SCHEDULE), min_length=1
     )
     seed_base: int = Field(default=42, description="Base seed for tournaments")
 
+    # blind_schedule as plain dicts, built once during validation
+    _blind_dicts: list[dict[str, Any]] = PrivateAttr(default_factory=list)
+    _blind_arrays: "BlindScheduleArrays" = PrivateAttr(
+        default_factory=lambda: BlindScheduleArrays((), (), ())
+    )
+
     @field_validator("blind_schedule")
     @classmethod
     def validate_blind_schedule(cls, v: list[BlindLevelConfig]) -> list[BlindLevelConfig]:
-        if not v:
-            raise ValueError("Blind schedule cannot be empty")
         if v[-1].hands is not None:
             raise ValueError("Last blind level must have hands=None (infinite)")
         return v
 
+    @model_validator(mode="after")
+    def _build_blind_dicts(self) -> "TournamentConfig":
+        self._blind_dicts = [
+            {"hands": level.hands, "sb": level.sb, "bb": level.bb}
+            for level in self.blind_schedule
+        ]
+        self._blind_arrays = BlindScheduleArrays(
+            hands=tuple(level.hands for level in self.blind_schedule),
+            sb=tuple(level.sb for level in self.blind_schedule),
+            bb=tuple(level.bb for level in self.blind_schedule),
+        )
+        return self
+
+    @property
+    def blind_schedule_dicts(self) -> list[dict[str, Any]]:
+        """The blind schedule as dicts with 'hands', 'sb', 'bb' keys.
+
+        Built during validation and shared; treat it as read-only.
+        """
+        return self._blind_dicts
+
+    @property
+    def blind_schedule_arrays(self) -> "BlindScheduleArrays":
+        """The blind schedule as parallel per-field tuples, built during validation."""
+        return self._blind_arrays
+
 
-class ReasoningConfig(BaseModel):
+class ReasoningConfig(_ConfigModel):
     """Configuration for model reasoning/thinking."""
 
     enabled: bool = Field(default=False, description="Enable reasoning for supported models")
@@ -66,7 +138,7 @@ class ReasoningConfig(BaseModel):
     )
 
 
-class ProviderConfig(BaseModel):
+class ProviderConfig(_ConfigModel):
     """Configuration for OpenRouter provider preferences.
     
     See: https://openrouter.ai/docs/api-reference/parameters
@@ -102,11 +174,11 @@ class ProviderConfig(BaseModel):
     )
 
 
-class AgentConfig(BaseModel):
+class AgentConfig(_ConfigModel):
     """Configuration for a single agent."""
 
     name: str
-    model: str = Field(default="openrouter/openai/gpt-4o")
+    model: str = Field(default=DEFAULT_MODEL)
     reasoning: ReasoningConfig | None = Field(
         default=None,
         description="Per-agent reasoning config (overrides global)"
@@ -117,37 +189,62 @@ class AgentConfig(BaseModel):
     )
 
 
-class AgentSettingsConfig(BaseModel):
+class AgentSettingsConfig(_ConfigModel):
     """Global settings for agents."""
 
     max_retries: int = Field(default=3, ge=1, description="Max retries for invalid actions")
     retry_on_invalid: bool = Field(default=True)
+    n_samples: int = Field(
+        default=1,
+        ge=1,
+        description="Completions per LLM request; extra samples are tried before a retry",
+    )
+    stream: bool = Field(
+        default=False,
+        description="Stream LLM responses and stop generating once the action JSON is complete",
+    )
+    enable_decision_cache: bool = Field(
+        default=False,
+        description="Reuse an agent's earlier decision for an identical (bucketed) game state",
+    )
+    enable_near_match_cache: bool = Field(
+        default=False,
+        description="Reuse an earlier decision for a similar state (same hand class, board texture, depth)",
+    )
+    adaptive_tool_turns: bool = Field(
+        default=False,
+        description="Stop sending tool definitions to agents that rarely call tools (re-offered periodically)",
+    )
     reasoning: ReasoningConfig | None = Field(
         default=None,
         description="Default reasoning config (fallback if agent doesn't specify)"
     )
 
 
-class OutputConfig(BaseModel):
+class OutputConfig(_ConfigModel):
     """Output configuration."""
 
     log_dir: str = Field(default="./logs")
     verbose: bool = Field(default=True)
 
 
-class BenchmarkConfig(BaseModel):
-    """Complete benchmark configuration."""
+_DEFAULT_AGENT_SETTINGS = AgentSettingsConfig.model_construct()
+_DEFAULT_OUTPUT = OutputConfig.model_construct()
+
+
+class BenchmarkConfig(_ConfigModel):
+    """Complete benchmark configuration.
+
+    The model itself accepts any number of agents, so the defaults (no
+    agents) stay constructible; config files are also checked with
+    `validate_agent_count` when parsed.
+    """
 
     tournament: TournamentConfig = Field(default_factory=TournamentConfig)
     agents: list[AgentConfig] = Field(default_factory=list)
-    agent_settings: AgentSettingsConfig = Field(default_factory=AgentSettingsConfig)
-    output: OutputConfig = Field(default_factory=OutputConfig)
-
-    @field_validator("agents")
-    @classmethod
-    def validate_agents(cls, v: list[AgentConfig], info) -> list[AgentConfig]:
-        # Allow empty agents list for validation, but will fail at runtime
-        return v
+    # Frozen defaults are shared rather than rebuilt for every config
+    agent_settings: AgentSettingsConfig = Field(default_factory=lambda: _DEFAULT_AGENT_SETTINGS)
+    output: OutputConfig = Field(default_factory=lambda: _DEFAULT_OUTPUT)
 
     def validate_agent_count(self) -> None:
         """Validate that agent count matches tournament seats."""
@@ -158,9 +255,54 @@ class BenchmarkConfig(BaseModel):
             )
 
 
+# Validator for whole config files, built once at import
+_BENCHMARK_ADAPTER = TypeAdapter(BenchmarkConfig)
+
+# Absolute path -> (mtime_ns, size, config) for the last version loaded from it
+_CONFIG_CACHE: dict[str, tuple[int, int, BenchmarkConfig]] = {}
+
+
+def parse_config(raw: bytes | str) -> BenchmarkConfig:
+    """Parse and validate configuration from raw JSON.
+
+    JSON is parsed and validated in one pass, without building an
+    intermediate dict, and the agent count is checked against the seats.
+    Unlike `load_config`, nothing is cached.
+
+    Args:
+        raw: Contents of a config.json file.
+
+    Returns:
+        Validated BenchmarkConfig object.
+
+    Raises:
+        ValueError: If the JSON or the configuration is invalid.
+    """
+    config = _BENCHMARK_ADAPTER.validate_json(raw)
+    config.validate_agent_count()
+    return config
+
+
+def _read_bytes(path: Path, size: int) -> bytes:
+    """Read a whole file with unbuffered reads sized from its stat."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # One read normally suffices; keep going in case the file grew
+        chunks = [os.read(fd, size + 1)]
+        while chunks[-1]:
+            chunks.append(os.read(fd, 65536))
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
 def load_config(config_path: Path | str) -> BenchmarkConfig:
     """Load configuration from a JSON file.
 
+    Loaded configs are cached per file and reused until the file's
+    modification time or size changes, so repeated loads skip parsing and
+    validation. Callers share the returned object and must not modify it.
+
     Args:
         config_path: Path to the config.json file.
 
@@ -173,18 +315,57 @@ def load_config(config_path: Path | str) -> BenchmarkConfig:
     """
     config_path = Path(config_path)
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
 
-    with open(config_path) as f:
-        data = json.load(f)
+    cache_key = os.path.abspath(config_path)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
 
-    config = BenchmarkConfig.model_validate(data)
-    config.validate_agent_count()
+    config = parse_config(_read_bytes(config_path, st.st_size))
 
+    _CONFIG_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, config)
     return config
 
 
+class ConfigWatcher:
+    """Hot-reload a config file for long-running processes.
+
+    Each `poll` costs a single stat while the file is unchanged; an edited
+    file is parsed and validated once (via `load_config`'s cache).
+    """
+
+    def __init__(self, config_path: Path | str) -> None:
+        """Initialize the watcher and load the current config.
+
+        Args:
+            config_path: Path to the config.json file.
+
+        Raises:
+            FileNotFoundError: If config file doesn't exist.
+            ValueError: If configuration is invalid.
+        """
+        self.config_path = Path(config_path)
+        self.config = load_config(self.config_path)
+
+    def poll(self) -> bool:
+        """Reload the config if the file changed since the last poll.
+
+        If the edited file is invalid, the error propagates and `config`
+        keeps the last valid version.
+
+        Returns:
+            True if `config` was replaced.
+        """
+        config = load_config(self.config_path)
+        changed = config is not self.config
+        self.config = config
+        return changed
+
+
 def get_blind_schedule_config(config: BenchmarkConfig) -> list[dict[str, Any]]:
     """Convert blind schedule config to format expected by BlindSchedule.
 
@@ -194,7 +375,28 @@ def get_blind_schedule_config(config: BenchmarkConfig) -> list[dict[str, Any]]:
     Returns:
         List of dicts with 'hands', 'sb', 'bb' keys.
     """
-    return [
-        {"hands": level.hands, "sb": level.sb, "bb": level.bb}
-        for level in config.tournament.blind_schedule
-    ]
+    return config.tournament.blind_schedule_dicts
+
+
+def get_blind_schedule_arrays(config: BenchmarkConfig) -> BlindScheduleArrays:
+    """Get the blind schedule as parallel hands/sb/bb tuples.
+
+    Args:
+        config: The benchmark configuration.
+
+    Returns:
+        BlindScheduleArrays with one entry per level in each tuple.
+    """
+    return config.tournament.blind_schedule_arrays
+
+
+@functools.cache
+def get_benchmark_json_schema() -> dict[str, Any]:
+    """Get the JSON schema of the config file format.
+
+    Generated on first use and shared afterwards; treat it as read-only.
+
+    Returns:
+        JSON schema for BenchmarkConfig.
+    """
+    return BenchmarkConfig.model_json_schema()
@@ -1,25 +1,63 @@
 """Health check for benchmark configuration and agent connectivity."""
 
+import functools
+import importlib.util
+import json
 import os
+import re
 import sys
 import time
-from dataclasses import dataclass, field
-from enum import Enum
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from enum import StrEnum, unique
 from pathlib import Path
 from typing import Any
 
 from dotenv import load_dotenv
+from pydantic_core import from_json, to_json
 
 
-class HealthStatus(Enum):
-    """Health check status."""
+def _elapsed_ms(start: float) -> float:
+    """Milliseconds since `start`, a time.perf_counter() reading."""
+    return (time.perf_counter() - start) * 1000.0
+
+
+@functools.cache
+def _load_dotenv_once() -> None:
+    """Load .env into the environment the first time it's needed."""
+    load_dotenv()
+
+
+@functools.cache
+def _adapter_classes() -> tuple[type, type, type, type]:
+    """Import the LLM adapter on first use.
+
+    litellm is slow to import, so this stays out of module import (runs
+    without --full never need it) and is resolved once for all agents.
+
+    Returns:
+        (LLMAdapter, LLMConfig, ProviderSettings, ReasoningSettings)
+    """
+    from live_poker_bench.llm.adapter import (
+        LLMAdapter,
+        LLMConfig,
+        ProviderSettings,
+        ReasoningSettings,
+    )
+    return LLMAdapter, LLMConfig, ProviderSettings, ReasoningSettings
+
+
+@unique
+class HealthStatus(StrEnum):
+    """Health check status; members are also their string values."""
     PASS = "pass"
     FAIL = "fail"
     WARN = "warn"
     SKIP = "skip"
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
     """Result of a single health check."""
     name: str
@@ -29,15 +67,27 @@ class CheckResult:
     duration_ms: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthReport:
     """Complete health report."""
     results: list[CheckResult] = field(default_factory=list)
     overall_status: HealthStatus = HealthStatus.PASS
+    # Results per status, and how many of `results` they cover. add() keeps
+    # them current; results passed in or appended directly are tallied on read.
+    _counts: Counter[HealthStatus] = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+    _counted: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._tally()
 
     def add(self, result: CheckResult) -> None:
         """Add a check result and update overall status."""
+        counts = self._tally()
         self.results.append(result)
+        counts[result.status] += 1
+        self._counted += 1
         if result.status == HealthStatus.FAIL:
             self.overall_status = HealthStatus.FAIL
         elif result.status == HealthStatus.WARN and self.overall_status == HealthStatus.PASS:
@@ -45,20 +95,99 @@ class HealthReport:
 
     @property
     def passed(self) -> int:
-        return sum(1 for r in self.results if r.status == HealthStatus.PASS)
+        return self._tally()[HealthStatus.PASS]
 
     @property
     def failed(self) -> int:
-        return sum(1 for r in self.results if r.status == HealthStatus.FAIL)
+        return self._tally()[HealthStatus.FAIL]
 
     @property
     def warnings(self) -> int:
-        return sum(1 for r in self.results if r.status == HealthStatus.WARN)
+        return self._tally()[HealthStatus.WARN]
+
+    def _tally(self) -> Counter[HealthStatus]:
+        """Get per-status counts, recounting if results changed outside add()."""
+        if self._counted != len(self.results):
+            self._counts = Counter(r.status for r in self.results)
+            self._counted = len(self.results)
+        return self._counts
+
+    def as_dict(self) -> dict[str, Any]:
+        """Convert the report to a JSON-compatible dict."""
+        return {
+            "overall": self.overall_status.value,
+            "results": [
+                {
+                    "name": r.name,
+                    "status": r.status.value,
+                    "message": r.message,
+                    "details": r.details,
+                    "duration_ms": r.duration_ms,
+                }
+                for r in self.results
+            ],
+        }
+
+    def as_json(self) -> bytes:
+        """Serialize the report to JSON bytes for machine consumption."""
+        return to_json(self.as_dict())
+
+
+# Upper bound on concurrent connectivity probes
+MAX_CONNECTIVITY_WORKERS = 16
+
+_VALID_EFFORTS = frozenset({"low", "medium", "high", "xhigh", None})
+
+# Models that require preserve_blocks for multi-turn reasoning
+# See: https://openrouter.ai/docs/guides/best-practices/reasoning-tokens#preserving-reasoning-blocks
+_GEMINI_RE = re.compile(r"google/gemini|gemini-", re.IGNORECASE)
+
+# Known OpenRouter provider names (lowercase for comparison)
+_KNOWN_PROVIDERS = frozenset({
+    "openai", "anthropic", "google", "google-vertex", "together",
+    "deepinfra", "groq", "fireworks", "lepton", "mancer", "novita",
+    "mistral", "perplexity", "replicate", "aws-bedrock", "azure",
+    "cohere", "ai21", "anyscale", "cloudflare", "deepseek", "hyperbolic",
+    "infermatic", "lambda", "lynn", "neversleep", "parasail", "featherless",
+})
+
+_VALID_DATA_COLLECTION = frozenset({"allow", "deny"})
+
+
+def _result(
+    name: str,
+    status: HealthStatus,
+    message: str,
+    start: float,
+    details: dict[str, Any] | None = None,
+) -> CheckResult:
+    """Build a check result timed from `start`, a time.perf_counter() reading."""
+    return CheckResult(
+        name=name,
+        status=status,
+        message=message,
+        details=details if details is not None else {},
+        duration_ms=_elapsed_ms(start),
+    )
+
+
+def _probe_key(
+    model: str, reasoning_enabled: bool, provider_config: dict[str, Any] | None
+) -> tuple[str, bool, str]:
+    """Key identifying connectivity probes that would send the same request."""
+    return (model, reasoning_enabled, json.dumps(provider_config or {}, sort_keys=True))
+
+
+def _for_agent(result: CheckResult, agent_name: str) -> CheckResult:
+    """Reuse another agent's connectivity result for `agent_name`."""
+    return replace(result, name=f"Agent: {agent_name}", duration_ms=0.0)
 
 
 class HealthChecker:
     """Runs health checks on the benchmark configuration."""
 
+    __slots__ = ("config_path", "verbose", "report", "config", "_raw_config")
+
     # ANSI color codes
     COLORS = {
         HealthStatus.PASS: "\033[92m",  # Green
@@ -81,6 +210,8 @@ class HealthChecker:
         self.verbose = verbose
         self.report = HealthReport()
         self.config = None
+        # Config file contents, read once by check_config_file
+        self._raw_config: bytes | None = None
 
     def _status_icon(self, status: HealthStatus) -> str:
         """Get status icon."""
@@ -99,112 +230,88 @@ class HealthChecker:
 
         color = self.COLORS.get(result.status, "")
         icon = self._status_icon(result.status)
-        status_text = result.status.value.upper()
+        status_text = result.status.upper()
 
-        print(f"  {color}{icon}{self.RESET} {result.name}: {color}{status_text}{self.RESET}")
+        # Written in one call so each result's lines stay together
+        lines = [f"  {color}{icon}{self.RESET} {result.name}: {color}{status_text}{self.RESET}\n"]
         if result.message:
-            print(f"    {self.DIM}{result.message}{self.RESET}")
+            lines.append(f"    {self.DIM}{result.message}{self.RESET}\n")
         if result.duration_ms > 0:
-            print(f"    {self.DIM}({result.duration_ms:.0f}ms){self.RESET}")
+            lines.append(f"    {self.DIM}({result.duration_ms:.0f}ms){self.RESET}\n")
+        sys.stdout.write("".join(lines))
 
     def _print_header(self, title: str) -> None:
         """Print a section header."""
         if self.verbose:
-            print(f"\n{self.BOLD}━━━ {title} ━━━{self.RESET}")
+            sys.stdout.write(f"\n{self.BOLD}━━━ {title} ━━━{self.RESET}\n")
 
     def check_config_file(self) -> CheckResult:
         """Check that config file exists and is valid JSON."""
-        start = time.time()
+        start = time.perf_counter()
         try:
-            if not self.config_path.exists():
-                return CheckResult(
-                    name="Config File",
-                    status=HealthStatus.FAIL,
-                    message=f"Config file not found: {self.config_path}",
-                    duration_ms=(time.time() - start) * 1000,
-                )
-
-            import json
-            with open(self.config_path) as f:
-                json.load(f)
-
-            return CheckResult(
-                name="Config File",
-                status=HealthStatus.PASS,
-                message=f"Found at {self.config_path}",
-                duration_ms=(time.time() - start) * 1000,
-            )
-        except json.JSONDecodeError as e:
-            return CheckResult(
-                name="Config File",
-                status=HealthStatus.FAIL,
-                message=f"Invalid JSON: {e}",
-                duration_ms=(time.time() - start) * 1000,
+            raw = self.config_path.read_bytes()
+            # Syntax check only; the schema check validates these bytes
+            from_json(raw)
+            self._raw_config = raw
+
+            return _result("Config File", HealthStatus.PASS, f"Found at {self.config_path}", start)
+        except FileNotFoundError:
+            return _result(
+                "Config File",
+                HealthStatus.FAIL,
+                f"Config file not found: {self.config_path}",
+                start,
             )
+        except ValueError as e:
+            return _result("Config File", HealthStatus.FAIL, f"Invalid JSON: {e}", start)
         except Exception as e:
-            return CheckResult(
-                name="Config File",
-                status=HealthStatus.FAIL,
-                message=str(e),
-                duration_ms=(time.time() - start) * 1000,
-            )
+            return _result("Config File", HealthStatus.FAIL, str(e), start)
 
     def check_config_schema(self) -> CheckResult:
         """Validate config against Pydantic schema."""
-        start = time.time()
+        start = time.perf_counter()
         try:
-            from live_poker_bench.config import load_config
-            self.config = load_config(self.config_path)
-
-            return CheckResult(
-                name="Config Schema",
-                status=HealthStatus.PASS,
-                message=f"{len(self.config.agents)} agents, {self.config.tournament.seats} seats",
-                duration_ms=(time.time() - start) * 1000,
+            from live_poker_bench.config import load_config, parse_config
+            # Reuse the bytes check_config_file already read, if any
+            if self._raw_config is not None:
+                self.config = parse_config(self._raw_config)
+            else:
+                self.config = load_config(self.config_path)
+
+            return _result(
+                "Config Schema",
+                HealthStatus.PASS,
+                f"{len(self.config.agents)} agents, {self.config.tournament.seats} seats",
+                start,
             )
         except ValueError as e:
-            return CheckResult(
-                name="Config Schema",
-                status=HealthStatus.FAIL,
-                message=str(e),
-                duration_ms=(time.time() - start) * 1000,
-            )
+            return _result("Config Schema", HealthStatus.FAIL, str(e), start)
         except Exception as e:
-            return CheckResult(
-                name="Config Schema",
-                status=HealthStatus.FAIL,
-                message=str(e),
-                duration_ms=(time.time() - start) * 1000,
-            )
+            return _result("Config Schema", HealthStatus.FAIL, str(e), start)
 
     def check_api_key(self) -> CheckResult:
         """Check that OPENROUTER_API_KEY is set."""
-        start = time.time()
-        load_dotenv()
+        start = time.perf_counter()
+        _load_dotenv_once()
 
         api_key = os.getenv("OPENROUTER_API_KEY")
 
         if not api_key:
-            return CheckResult(
-                name="API Key",
-                status=HealthStatus.FAIL,
-                message="OPENROUTER_API_KEY not found in environment",
-                duration_ms=(time.time() - start) * 1000,
+            return _result(
+                "API Key",
+                HealthStatus.FAIL,
+                "OPENROUTER_API_KEY not found in environment",
+                start,
             )
 
         # Mask key for display
         masked = f"{api_key[:8]}...{api_key[-4:]}" if len(api_key) > 12 else "***"
 
-        return CheckResult(
-            name="API Key",
-            status=HealthStatus.PASS,
-            message=f"Found: {masked}",
-            duration_ms=(time.time() - start) * 1000,
-        )
+        return _result("API Key", HealthStatus.PASS, f"Found: {masked}", start)
 
     def check_dependencies(self) -> CheckResult:
         """Check that required packages are installed."""
-        start = time.time()
+        start = time.perf_counter()
         missing = []
         installed = []
 
@@ -214,27 +321,31 @@ class HealthChecker:
             ("dotenv", "python-dotenv"),
         ]
 
+        # find_spec locates a package without running its (possibly heavy) init
         for import_name, pip_name in packages:
             try:
-                __import__(import_name)
+                found = importlib.util.find_spec(import_name) is not None
+            except (ImportError, ValueError):
+                found = False
+            if found:
                 installed.append(pip_name)
-            except ImportError:
+            else:
                 missing.append(pip_name)
 
         if missing:
-            return CheckResult(
-                name="Dependencies",
-                status=HealthStatus.FAIL,
-                message=f"Missing: {', '.join(missing)}",
+            return _result(
+                "Dependencies",
+                HealthStatus.FAIL,
+                f"Missing: {', '.join(missing)}",
+                start,
                 details={"missing": missing, "installed": installed},
-                duration_ms=(time.time() - start) * 1000,
             )
 
-        return CheckResult(
-            name="Dependencies",
-            status=HealthStatus.PASS,
-            message=f"All {len(installed)} required packages found",
-            duration_ms=(time.time() - start) * 1000,
+        return _result(
+            "Dependencies",
+            HealthStatus.PASS,
+            f"All {len(installed)} required packages found",
+            start,
         )
 
     def check_agent_connectivity(
@@ -255,15 +366,10 @@ class HealthChecker:
         Returns:
             CheckResult with connectivity status.
         """
-        start = time.time()
+        start = time.perf_counter()
 
         try:
-            from live_poker_bench.llm.adapter import (
-                LLMAdapter,
-                LLMConfig,
-                ProviderSettings,
-                ReasoningSettings,
-            )
+            LLMAdapter, LLMConfig, ProviderSettings, ReasoningSettings = _adapter_classes()
 
             # Create adapter with appropriate config
             # For thinking models, we need to pass reasoning settings
@@ -301,7 +407,6 @@ class HealthChecker:
             ]
 
             response = adapter.call(test_messages)
-            duration_ms = (time.time() - start) * 1000
 
             # Check both content and reasoning_content for thinking models
             response_text = response.content or response.reasoning_content
@@ -335,106 +440,85 @@ class HealthChecker:
                         status = HealthStatus.WARN
                         msg += f" (requested: {requested})"
                 
-                return CheckResult(
-                    name=f"Agent: {agent_name}",
-                    status=status,
-                    message=msg,
-                    details=details,
-                    duration_ms=duration_ms,
-                )
+                return _result(f"Agent: {agent_name}", status, msg, start, details=details)
             else:
-                return CheckResult(
-                    name=f"Agent: {agent_name}",
-                    status=HealthStatus.WARN,
-                    message=f"Empty response from {model}",
+                return _result(
+                    f"Agent: {agent_name}",
+                    HealthStatus.WARN,
+                    f"Empty response from {model}",
+                    start,
                     details={"model": model, "raw_content": response.content, "raw_reasoning": response.reasoning_content},
-                    duration_ms=duration_ms,
                 )
 
         except Exception as e:
-            return CheckResult(
-                name=f"Agent: {agent_name}",
-                status=HealthStatus.FAIL,
-                message=f"Failed: {str(e)[:100]}",
+            return _result(
+                f"Agent: {agent_name}",
+                HealthStatus.FAIL,
+                f"Failed: {str(e)[:100]}",
+                start,
                 details={"model": model, "error": str(e)},
-                duration_ms=(time.time() - start) * 1000,
             )
 
     def check_log_directory(self) -> CheckResult:
         """Check that log directory is writable."""
-        start = time.time()
+        start = time.perf_counter()
 
         if self.config is None:
-            return CheckResult(
-                name="Log Directory",
-                status=HealthStatus.SKIP,
-                message="Config not loaded",
-                duration_ms=(time.time() - start) * 1000,
-            )
+            return _result("Log Directory", HealthStatus.SKIP, "Config not loaded", start)
 
         log_dir = Path(self.config.output.log_dir)
 
         try:
-            # Try to create directory and write a test file
-            log_dir.mkdir(parents=True, exist_ok=True)
-            test_file = log_dir / ".health_check_test"
-            test_file.write_text("test")
-            test_file.unlink()
-
-            return CheckResult(
-                name="Log Directory",
-                status=HealthStatus.PASS,
-                message=f"Writable: {log_dir}",
-                duration_ms=(time.time() - start) * 1000,
-            )
+            # An existing directory only needs a permission check; otherwise
+            # try to create it and write a test file
+            if not (log_dir.is_dir() and os.access(log_dir, os.W_OK)):
+                log_dir.mkdir(parents=True, exist_ok=True)
+                test_file = log_dir / ".health_check_test"
+                test_file.write_text("test")
+                test_file.unlink()
+
+            return _result("Log Directory", HealthStatus.PASS, f"Writable: {log_dir}", start)
         except Exception as e:
-            return CheckResult(
-                name="Log Directory",
-                status=HealthStatus.FAIL,
-                message=f"Cannot write to {log_dir}: {e}",
-                duration_ms=(time.time() - start) * 1000,
+            return _result(
+                "Log Directory",
+                HealthStatus.FAIL,
+                f"Cannot write to {log_dir}: {e}",
+                start,
             )
 
     def check_blind_schedule(self) -> CheckResult:
         """Validate blind schedule configuration."""
-        start = time.time()
+        start = time.perf_counter()
 
         if self.config is None:
-            return CheckResult(
-                name="Blind Schedule",
-                status=HealthStatus.SKIP,
-                message="Config not loaded",
-                duration_ms=(time.time() - start) * 1000,
-            )
+            return _result("Blind Schedule", HealthStatus.SKIP, "Config not loaded", start)
 
         schedule = self.config.tournament.blind_schedule
         issues = []
 
-        # Check for increasing blinds
+        # Check for increasing blinds, counting hands in the same pass. The
+        # final level only adds to the total if it's finite, which is
+        # reported as an issue below.
         prev_bb = 0
+        total_hands = 0
         for i, level in enumerate(schedule):
             if level.bb <= prev_bb:
                 issues.append(f"Level {i+1} BB ({level.bb}) not greater than previous ({prev_bb})")
             prev_bb = level.bb
+            total_hands += level.hands or 0
 
         # Check last level has infinite hands
         if schedule[-1].hands is not None:
             issues.append("Last level must have hands=null (infinite)")
 
         if issues:
-            return CheckResult(
-                name="Blind Schedule",
-                status=HealthStatus.WARN,
-                message="; ".join(issues),
-                duration_ms=(time.time() - start) * 1000,
-            )
+            return _result("Blind Schedule", HealthStatus.WARN, "; ".join(issues), start)
 
-        total_hands = sum(l.hands or 0 for l in schedule[:-1])
-        return CheckResult(
-            name="Blind Schedule",
-            status=HealthStatus.PASS,
-            message=f"{len(schedule)} levels, {total_hands}+ hands before final level",
-            duration_ms=(time.time() - start) * 1000,
+        return _result(
+            "Blind Schedule",
+            HealthStatus.PASS,
+            f"{len(schedule)} levels, {total_hands}+ hands before final level",
+            start,
         )
 
     def check_reasoning_config(self) -> CheckResult:
@@ -445,24 +529,14 @@ class HealthChecker:
         - Gemini models require preserve_blocks=true for multi-turn
         - Warns about models that may not support reasoning
         """
-        start = time.time()
+        start = time.perf_counter()
 
         if self.config is None:
-            return CheckResult(
-                name="Reasoning Config",
-                status=HealthStatus.SKIP,
-                message="Config not loaded",
-                duration_ms=(time.time() - start) * 1000,
-            )
+            return _result("Reasoning Config", HealthStatus.SKIP, "Config not loaded", start)
 
         issues = []
         warnings = []
         agents_with_reasoning = 0
-        valid_efforts = {"low", "medium", "high", "xhigh", None}
-
-        # Models that require preserve_blocks for multi-turn reasoning
-        # See: https://openrouter.ai/docs/guides/best-practices/reasoning-tokens#preserving-reasoning-blocks
-        gemini_patterns = ["google/gemini", "gemini-"]
 
         for agent in self.config.agents:
             reasoning = agent.reasoning
@@ -473,49 +547,37 @@ class HealthChecker:
                 agents_with_reasoning += 1
 
                 # Check effort level is valid
-                if reasoning.effort not in valid_efforts:
+                if reasoning.effort not in _VALID_EFFORTS:
                     issues.append(
                         f"{agent.name}: invalid effort '{reasoning.effort}' "
                         f"(valid: low, medium, high, xhigh)"
                     )
 
                 # Check Gemini models have preserve_blocks enabled
-                model_lower = agent.model.lower()
-                is_gemini = any(pattern in model_lower for pattern in gemini_patterns)
-                if is_gemini and not reasoning.preserve_blocks:
+                if not reasoning.preserve_blocks and _GEMINI_RE.search(agent.model):
                     warnings.append(
                         f"{agent.name}: Gemini models require preserve_blocks=true for multi-turn reasoning"
                     )
 
         if issues:
-            return CheckResult(
-                name="Reasoning Config",
-                status=HealthStatus.FAIL,
-                message="; ".join(issues),
-                duration_ms=(time.time() - start) * 1000,
-            )
+            return _result("Reasoning Config", HealthStatus.FAIL, "; ".join(issues), start)
 
         if warnings:
-            return CheckResult(
-                name="Reasoning Config",
-                status=HealthStatus.WARN,
-                message="; ".join(warnings),
-                duration_ms=(time.time() - start) * 1000,
-            )
+            return _result("Reasoning Config", HealthStatus.WARN, "; ".join(warnings), start)
 
         if agents_with_reasoning == 0:
-            return CheckResult(
-                name="Reasoning Config",
-                status=HealthStatus.PASS,
-                message="No agents have reasoning enabled",
-                duration_ms=(time.time() - start) * 1000,
+            return _result(
+                "Reasoning Config",
+                HealthStatus.PASS,
+                "No agents have reasoning enabled",
+                start,
             )
 
-        return CheckResult(
-            name="Reasoning Config",
-            status=HealthStatus.PASS,
-            message=f"{agents_with_reasoning} agent(s) with reasoning enabled",
-            duration_ms=(time.time() - start) * 1000,
+        return _result(
+            "Reasoning Config",
+            HealthStatus.PASS,
+            f"{agents_with_reasoning} agent(s) with reasoning enabled",
+            start,
         )
 
     def check_provider_config(self) -> CheckResult:
@@ -526,31 +588,15 @@ class HealthChecker:
         - Conflicting settings (order + only)
         - Data collection values
         """
-        start = time.time()
+        start = time.perf_counter()
 
         if self.config is None:
-            return CheckResult(
-                name="Provider Config",
-                status=HealthStatus.SKIP,
-                message="Config not loaded",
-                duration_ms=(time.time() - start) * 1000,
-            )
+            return _result("Provider Config", HealthStatus.SKIP, "Config not loaded", start)
 
         issues = []
         warnings = []
         agents_with_provider = 0
 
-        # Known OpenRouter provider names (lowercase for comparison)
-        known_providers = {
-            "openai", "anthropic", "google", "google-vertex", "together",
-            "deepinfra", "groq", "fireworks", "lepton", "mancer", "novita",
-            "mistral", "perplexity", "replicate", "aws-bedrock", "azure",
-            "cohere", "ai21", "anyscale", "cloudflare", "deepseek", "hyperbolic",
-            "infermatic", "lambda", "lynn", "neversleep", "parasail", "featherless",
-        }
-
-        valid_data_collection = {"allow", "deny"}
-
         for agent in self.config.agents:
             provider = agent.provider
             if provider is None:
@@ -565,7 +611,7 @@ class HealthChecker:
                 )
 
             # Validate data_collection value
-            if provider.data_collection and provider.data_collection not in valid_data_collection:
+            if provider.data_collection and provider.data_collection not in _VALID_DATA_COLLECTION:
                 issues.append(
                     f"{agent.name}: invalid data_collection '{provider.data_collection}' "
                     f"(valid: allow, deny)"
@@ -574,41 +620,36 @@ class HealthChecker:
             # Check provider names (warn if unknown, might just be new)
             all_providers = (provider.order or []) + (provider.only or []) + (provider.ignore or [])
             for p in all_providers:
-                if p.lower() not in known_providers:
+                if p.lower() not in _KNOWN_PROVIDERS:
                     warnings.append(
                         f"{agent.name}: unknown provider '{p}' (may be valid, just not in known list)"
                     )
 
         if issues:
-            return CheckResult(
-                name="Provider Config",
-                status=HealthStatus.FAIL,
-                message="; ".join(issues),
-                duration_ms=(time.time() - start) * 1000,
-            )
+            return _result("Provider Config", HealthStatus.FAIL, "; ".join(issues), start)
 
         if warnings:
-            return CheckResult(
-                name="Provider Config",
-                status=HealthStatus.WARN,
-                message="; ".join(warnings[:2]),  # Limit to first 2 warnings
+            return _result(
+                "Provider Config",
+                HealthStatus.WARN,
+                "; ".join(warnings[:2]),  # Limit to first 2 warnings
+                start,
                 details={"all_warnings": warnings},
-                duration_ms=(time.time() - start) * 1000,
             )
 
         if agents_with_provider == 0:
-            return CheckResult(
-                name="Provider Config",
-                status=HealthStatus.PASS,
-                message="No agents have provider preferences configured",
-                duration_ms=(time.time() - start) * 1000,
+            return _result(
+                "Provider Config",
+                HealthStatus.PASS,
+                "No agents have provider preferences configured",
+                start,
             )
 
-        return CheckResult(
-            name="Provider Config",
-            status=HealthStatus.PASS,
-            message=f"{agents_with_provider} agent(s) with provider preferences",
-            duration_ms=(time.time() - start) * 1000,
+        return _result(
+            "Provider Config",
+            HealthStatus.PASS,
+            f"{agents_with_provider} agent(s) with provider preferences",
+            start,
         )
 
     def run_all(self, skip_connectivity: bool = False) -> HealthReport:
@@ -675,54 +716,110 @@ class HealthChecker:
             if self.verbose:
                 print(f"  {self.DIM}Testing {len(self.config.agents)} agents (this may take a moment)...{self.RESET}")
 
+            self._check_all_connectivity()
+        elif skip_connectivity:
+            self._print_header("Agent Connectivity")
+            if self.verbose:
+                print(f"  {self.DIM}Skipped (use --full to test connectivity){self.RESET}")
+
+        return self.report
+
+    def _check_all_connectivity(self) -> None:
+        """Probe every agent's model concurrently.
+
+        Each probe is a blocking HTTP round-trip, so they run on a thread
+        pool. Agents that would send an identical probe share one request.
+        Results are recorded and printed on the calling thread in config
+        order, so output is stable and the report and stdout need no locking.
+        """
+        # Distinct probes, the agents sharing each, and each agent's probe
+        probes: dict[tuple[str, bool, str], tuple[str, bool, dict[str, Any] | None]] = {}
+        agent_names: dict[tuple[str, bool, str], list[str]] = {}
+        agent_keys: list[tuple[str, bool, str]] = []
+        for agent in self.config.agents:
+            # Pass reasoning_enabled to help with thinking models
+            reasoning_enabled = (
+                agent.reasoning is not None and agent.reasoning.enabled
+            )
+            # Pass provider config if specified
+            provider_config = None
+            if agent.provider is not None:
+                provider_config = agent.provider.model_dump(exclude_none=True)
+            key = _probe_key(agent.model, reasoning_enabled, provider_config)
+            probes.setdefault(key, (agent.model, reasoning_enabled, provider_config))
+            agent_names.setdefault(key, []).append(agent.name)
+            agent_keys.append(key)
+        if not probes:
+            return
+
+        # Import the adapter here, before any workers exist: threads racing
+        # to import litellm for the first time can deadlock on its imports.
+        # Workers then get the classes from _adapter_classes' cache.
+        start = time.perf_counter()
+        try:
+            _adapter_classes()
+        except Exception as e:
             for agent in self.config.agents:
-                # Pass reasoning_enabled to help with thinking models
-                reasoning_enabled = (
-                    agent.reasoning is not None and agent.reasoning.enabled
+                result = _result(
+                    f"Agent: {agent.name}",
+                    HealthStatus.FAIL,
+                    f"Failed: {str(e)[:100]}",
+                    start,
+                    details={"model": agent.model, "error": str(e)},
                 )
-                # Pass provider config if specified
-                provider_config = None
-                if agent.provider is not None:
-                    provider_config = agent.provider.model_dump(exclude_none=True)
-                result = self.check_agent_connectivity(
-                    agent.name,
-                    agent.model,
+                self.report.add(result)
+                self._print_result(result)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONNECTIVITY_WORKERS, len(probes))) as ex:
+            futures = {
+                key: ex.submit(
+                    self.check_agent_connectivity,
+                    agent_names[key][0],
+                    model,
                     reasoning_enabled=reasoning_enabled,
                     provider_config=provider_config,
                 )
+                for key, (model, reasoning_enabled, provider_config) in probes.items()
+            }
+
+            # Wait on each agent's probe in config order; the first agent in a
+            # group gets the probe's result, the rest a renamed copy
+            reported: set[tuple[str, bool, str]] = set()
+            for agent, key in zip(self.config.agents, agent_keys):
+                result = futures[key].result()
+                if key in reported:
+                    result = _for_agent(result, agent.name)
+                reported.add(key)
                 self.report.add(result)
                 self._print_result(result)
-        elif skip_connectivity:
-            self._print_header("Agent Connectivity")
-            if self.verbose:
-                print(f"  {self.DIM}Skipped (use --full to test connectivity){self.RESET}")
-
-        return self.report
 
     def print_summary(self) -> None:
         """Print a summary of the health check."""
         if not self.verbose:
             return
 
-        print(f"\n{self.BOLD}━━━ Summary ━━━{self.RESET}")
-
         color = self.COLORS.get(self.report.overall_status, "")
-        status_text = self.report.overall_status.value.upper()
+        status_text = self.report.overall_status.upper()
 
-        print(f"  Overall: {color}{self.BOLD}{status_text}{self.RESET}")
-        print(f"  {self.COLORS[HealthStatus.PASS]}✓{self.RESET} Passed: {self.report.passed}")
+        lines = [
+            f"\n{self.BOLD}━━━ Summary ━━━{self.RESET}\n",
+            f"  Overall: {color}{self.BOLD}{status_text}{self.RESET}\n",
+            f"  {self.COLORS[HealthStatus.PASS]}✓{self.RESET} Passed: {self.report.passed}\n",
+        ]
         if self.report.warnings > 0:
-            print(f"  {self.COLORS[HealthStatus.WARN]}⚠{self.RESET} Warnings: {self.report.warnings}")
+            lines.append(f"  {self.COLORS[HealthStatus.WARN]}⚠{self.RESET} Warnings: {self.report.warnings}\n")
         if self.report.failed > 0:
-            print(f"  {self.COLORS[HealthStatus.FAIL]}✗{self.RESET} Failed: {self.report.failed}")
-
-        print()
+            lines.append(f"  {self.COLORS[HealthStatus.FAIL]}✗{self.RESET} Failed: {self.report.failed}\n")
+        lines.append("\n")
+        sys.stdout.write("".join(lines))
 
 
 def run_health_check(
     config_path: Path | str = "config.json",
     verbose: bool = True,
     full: bool = False,
+    json_output: bool = False,
 ) -> bool:
     """Run health checks and return success status.
 
@@ -730,10 +827,18 @@ def run_health_check(
         config_path: Path to configuration file.
         verbose: Whether to print detailed output.
         full: Run full checks including slow connectivity tests.
+        json_output: Write the report to stdout as JSON instead of the
+            human-readable output.
 
     Returns:
         True if all checks passed, False otherwise.
     """
+    if json_output:
+        report = HealthChecker(config_path, verbose=False).run_all(skip_connectivity=not full)
+        sys.stdout.buffer.write(report.as_json() + b"\n")
+        sys.stdout.flush()
+        return report.overall_status != HealthStatus.FAIL
+
     if verbose:
         print(f"\n{'━' * 40}")
         print("  🏥 LivePokerBench Health Check")
@@ -769,6 +874,11 @@ def main() -> None:
         action="store_true",
         help="Suppress output, only return exit code",
     )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the report as JSON",
+    )
 
     args = parser.parse_args()
 
@@ -776,6 +886,7 @@ def main() -> None:
         config_path=args.config,
         verbose=not args.quiet,
         full=args.full,
+        json_output=args.json,
     )
 
     sys.exit(0 if success else 1)
@@ -1,20 +1,29 @@
 """LLM adapter using litellm for unified model access."""
 
+import asyncio
+import json
 import os
+import threading
 import time
+from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, TypeVar
 
 # Suppress litellm's verbose output BEFORE importing
 os.environ["LITELLM_LOG"] = "ERROR"
 
 import litellm
 from dotenv import load_dotenv
+from pydantic_core import from_json
+
+from live_poker_bench.config import DEFAULT_MODEL
 
 # Disable litellm's verbose logging
 litellm.suppress_debug_info = True
 litellm.set_verbose = False
 
+T = TypeVar("T")
+
 
 @dataclass
 class ReasoningSettings:
@@ -62,7 +71,7 @@ class ProviderSettings:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Response from an LLM call."""
 
@@ -75,6 +84,7 @@ class LLMResponse:
     reasoning_content: str | None = None
     reasoning_details: list[dict[str, Any]] | None = None  # For preserving reasoning blocks
     provider_name: str | None = None  # The provider that served the request (from OpenRouter)
+    alternatives: list[str | None] = field(default_factory=list)  # Text of extra sampled choices (n > 1)
 
 
 @dataclass
@@ -89,6 +99,9 @@ class LLMConfig:
     retry_multiplier: float = 2.0
     reasoning: ReasoningSettings = field(default_factory=ReasoningSettings)
     provider: ProviderSettings | None = None
+    n_samples: int = 1  # Completions per request; extra samples back up an unparseable first choice
+    stream: bool = False  # Stream async completions so generation can stop once the answer is complete
+    parallel_tool_calls: bool | None = None  # Let the model request several tools per turn (None: provider default)
 
 
 class LLMAdapter:
@@ -106,11 +119,152 @@ class LLMAdapter:
         if not self.api_key:
             raise ValueError("OPENROUTER_API_KEY not found in environment")
 
-        self.config = config or LLMConfig(model="openrouter/openai/gpt-4o")
+        self.config = config or LLMConfig(model=DEFAULT_MODEL)
 
         # Configure litellm for OpenRouter
         litellm.drop_params = True  # Drop unsupported params silently
 
+    def _build_kwargs(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        reasoning: ReasoningSettings,
+        provider: ProviderSettings | None,
+    ) -> dict[str, Any]:
+        """Build the litellm request kwargs for a single call."""
+        kwargs: dict[str, Any] = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "api_key": self.api_key,
+        }
+
+        if self.config.n_samples > 1:
+            kwargs["n"] = self.config.n_samples
+
+        if tools:
+            kwargs["tools"] = tools
+            kwargs["tool_choice"] = "auto"
+            if self.config.parallel_tool_calls is not None:
+                kwargs["parallel_tool_calls"] = self.config.parallel_tool_calls
+
+        # Add reasoning parameters if enabled
+        if reasoning.enabled:
+            reasoning_config: dict[str, Any] = {}
+            if reasoning.effort:
+                reasoning_config["effort"] = reasoning.effort
+            if reasoning.max_tokens:
+                reasoning_config["max_tokens"] = reasoning.max_tokens
+            if reasoning_config:
+                kwargs["reasoning"] = reasoning_config
+            if reasoning.include_reasoning:
+                kwargs["include_reasoning"] = True
+
+        # Add provider preferences if specified (use extra_body for OpenRouter)
+        if provider:
+            provider_dict = provider.to_dict()
+            if provider_dict:
+                # OpenRouter expects provider in the request body
+                # Use extra_body to pass through to the API
+                if "extra_body" not in kwargs:
+                    kwargs["extra_body"] = {}
+                kwargs["extra_body"]["provider"] = provider_dict
+
+        return kwargs
+
+    def _parse_response(self, response: Any, model: str, latency_ms: float) -> LLMResponse:
+        """Convert a litellm response into an LLMResponse."""
+        # Extract response data
+        choice = response.choices[0]
+        message = choice.message
+
+        # Extract tool calls if present
+        tool_calls = []
+        if hasattr(message, "tool_calls") and message.tool_calls:
+            for tc in message.tool_calls:
+                tool_calls.append({
+                    "id": tc.id,
+                    "type": "function",
+                    "function": {
+                        "name": tc.function.name,
+                        "arguments": tc.function.arguments,
+                    },
+                })
+
+        # Extract usage
+        usage = {}
+        if hasattr(response, "usage") and response.usage:
+            usage = {
+                "prompt_tokens": response.usage.prompt_tokens,
+                "completion_tokens": response.usage.completion_tokens,
+                "total_tokens": response.usage.total_tokens,
+            }
+            # Include reasoning tokens if present
+            if hasattr(response.usage, "reasoning_tokens"):
+                usage["reasoning_tokens"] = response.usage.reasoning_tokens
+            # Prompt tokens served from the provider's prompt cache
+            details = getattr(response.usage, "prompt_tokens_details", None)
+            cached_tokens = getattr(details, "cached_tokens", None)
+            if cached_tokens:
+                usage["cached_tokens"] = cached_tokens
+            cache_write_tokens = getattr(response.usage, "cache_creation_input_tokens", None)
+            if cache_write_tokens:
+                usage["cache_write_tokens"] = cache_write_tokens
+
+        # Extract reasoning content if present
+        reasoning_content = None
+        if hasattr(message, "reasoning_content"):
+            reasoning_content = message.reasoning_content
+        elif hasattr(message, "reasoning") and message.reasoning:
+            # Some models return reasoning in a different format
+            reasoning_content = message.reasoning
+
+        # Extract reasoning_details for multi-turn preservation (Gemini, etc.)
+        # See: https://openrouter.ai/docs/guides/best-practices/reasoning-tokens#preserving-reasoning-blocks
+        reasoning_details = None
+        if hasattr(message, "reasoning_details") and message.reasoning_details:
+            reasoning_details = message.reasoning_details
+
+        # Extract provider name from OpenRouter response
+        # OpenRouter includes this in _hidden_params or response headers
+        provider_name = None
+        if hasattr(response, "_hidden_params"):
+            hidden = response._hidden_params or {}
+            # Check for provider in various locations
+            if "openrouter_provider" in hidden:
+                provider_name = hidden["openrouter_provider"]
+            elif "model_info" in hidden and isinstance(hidden["model_info"], dict):
+                provider_name = hidden["model_info"].get("provider")
+
+        # Also check response headers if available
+        if provider_name is None and hasattr(response, "_response_headers"):
+            headers = response._response_headers or {}
+            # OpenRouter may include provider in custom headers
+            provider_name = headers.get("x-openrouter-provider")
+
+        # Extra choices are only used as fallback final answers; tool calls come from the first
+        alternatives = [
+            c.message.content or getattr(c.message, "reasoning_content", None)
+            for c in response.choices[1:]
+        ]
+
+        return LLMResponse(
+            content=message.content,
+            tool_calls=tool_calls,
+            usage=usage,
+            model=model,
+            latency_ms=latency_ms,
+            raw_response=response,
+            reasoning_content=reasoning_content,
+            reasoning_details=reasoning_details,
+            provider_name=provider_name,
+            alternatives=alternatives,
+        )
+
     def call(
         self,
         messages: list[dict[str, Any]],
@@ -136,126 +290,25 @@ class LLMAdapter:
             LLMResponse with content, tool calls, and usage stats.
         """
         model = model or self.config.model
-        temperature = temperature if temperature is not None else self.config.temperature
-        max_tokens = max_tokens or self.config.max_tokens
-        reasoning = reasoning or self.config.reasoning
-        provider = provider or self.config.provider
+        kwargs = self._build_kwargs(
+            messages,
+            tools,
+            model,
+            temperature if temperature is not None else self.config.temperature,
+            max_tokens or self.config.max_tokens,
+            reasoning or self.config.reasoning,
+            provider or self.config.provider,
+        )
 
         last_error: Exception | None = None
         delay = self.config.retry_delay
 
         for attempt in range(self.config.max_retries):
             try:
-                start_time = time.time()
-
-                kwargs: dict[str, Any] = {
-                    "model": model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                    "api_key": self.api_key,
-                }
-
-                if tools:
-                    kwargs["tools"] = tools
-                    kwargs["tool_choice"] = "auto"
-
-                # Add reasoning parameters if enabled
-                if reasoning.enabled:
-                    reasoning_config: dict[str, Any] = {}
-                    if reasoning.effort:
-                        reasoning_config["effort"] = reasoning.effort
-                    if reasoning.max_tokens:
-                        reasoning_config["max_tokens"] = reasoning.max_tokens
-                    if reasoning_config:
-                        kwargs["reasoning"] = reasoning_config
-                    if reasoning.include_reasoning:
-                        kwargs["include_reasoning"] = True
-
-                # Add provider preferences if specified (use extra_body for OpenRouter)
-                if provider:
-                    provider_dict = provider.to_dict()
-                    if provider_dict:
-                        # OpenRouter expects provider in the request body
-                        # Use extra_body to pass through to the API
-                        if "extra_body" not in kwargs:
-                            kwargs["extra_body"] = {}
-                        kwargs["extra_body"]["provider"] = provider_dict
-
+                start_ns = time.perf_counter_ns()
                 response = litellm.completion(**kwargs)
-                latency_ms = (time.time() - start_time) * 1000
-
-                # Extract response data
-                choice = response.choices[0]
-                message = choice.message
-
-                # Extract tool calls if present
-                tool_calls = []
-                if hasattr(message, "tool_calls") and message.tool_calls:
-                    for tc in message.tool_calls:
-                        tool_calls.append({
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.function.name,
-                                "arguments": tc.function.arguments,
-                            },
-                        })
-
-                # Extract usage
-                usage = {}
-                if hasattr(response, "usage") and response.usage:
-                    usage = {
-                        "prompt_tokens": response.usage.prompt_tokens,
-                        "completion_tokens": response.usage.completion_tokens,
-                        "total_tokens": response.usage.total_tokens,
-                    }
-                    # Include reasoning tokens if present
-                    if hasattr(response.usage, "reasoning_tokens"):
-                        usage["reasoning_tokens"] = response.usage.reasoning_tokens
-
-                # Extract reasoning content if present
-                reasoning_content = None
-                if hasattr(message, "reasoning_content"):
-                    reasoning_content = message.reasoning_content
-                elif hasattr(message, "reasoning") and message.reasoning:
-                    # Some models return reasoning in a different format
-                    reasoning_content = message.reasoning
-
-                # Extract reasoning_details for multi-turn preservation (Gemini, etc.)
-                # See: https://openrouter.ai/docs/guides/best-practices/reasoning-tokens#preserving-reasoning-blocks
-                reasoning_details = None
-                if hasattr(message, "reasoning_details") and message.reasoning_details:
-                    reasoning_details = message.reasoning_details
-
-                # Extract provider name from OpenRouter response
-                # OpenRouter includes this in _hidden_params or response headers
-                provider_name = None
-                if hasattr(response, "_hidden_params"):
-                    hidden = response._hidden_params or {}
-                    # Check for provider in various locations
-                    if "openrouter_provider" in hidden:
-                        provider_name = hidden["openrouter_provider"]
-                    elif "model_info" in hidden and isinstance(hidden["model_info"], dict):
-                        provider_name = hidden["model_info"].get("provider")
-                
-                # Also check response headers if available
-                if provider_name is None and hasattr(response, "_response_headers"):
-                    headers = response._response_headers or {}
-                    # OpenRouter may include provider in custom headers
-                    provider_name = headers.get("x-openrouter-provider")
-
-                return LLMResponse(
-                    content=message.content,
-                    tool_calls=tool_calls,
-                    usage=usage,
-                    model=model,
-                    latency_ms=latency_ms,
-                    raw_response=response,
-                    reasoning_content=reasoning_content,
-                    reasoning_details=reasoning_details,
-                    provider_name=provider_name,
-                )
+                latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                return self._parse_response(response, model, latency_ms)
 
             except Exception as e:
                 last_error = e
@@ -265,11 +318,187 @@ class LLMAdapter:
 
         raise RuntimeError(f"LLM call failed after {self.config.max_retries} retries: {last_error}")
 
+    async def acall(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        reasoning: ReasoningSettings | None = None,
+        provider: ProviderSettings | None = None,
+        stop_when: Callable[[str], bool] | None = None,
+    ) -> LLMResponse:
+        """Async variant of `call` using `litellm.acompletion`.
+
+        Takes the same arguments as `call`. Waiting on the network does not
+        block the event loop, so decisions for several agents can overlap.
+
+        Args:
+            stop_when: Predicate on the text streamed so far. With
+                `config.stream` enabled, generation is cut off as soon as it
+                returns True, skipping whatever the model would write after
+                its answer.
+        """
+        model = model or self.config.model
+        kwargs = self._build_kwargs(
+            messages,
+            tools,
+            model,
+            temperature if temperature is not None else self.config.temperature,
+            max_tokens or self.config.max_tokens,
+            reasoning or self.config.reasoning,
+            provider or self.config.provider,
+        )
+
+        # Streaming only pays off when the caller can tell the answer is complete;
+        # multiple sampled choices would interleave in the stream
+        stream = self.config.stream and stop_when is not None and self.config.n_samples == 1
+        if stream:
+            kwargs["stream"] = True
+            kwargs["stream_options"] = {"include_usage": True}
+
+        last_error: Exception | None = None
+        delay = self.config.retry_delay
+
+        for attempt in range(self.config.max_retries):
+            try:
+                start_ns = time.perf_counter_ns()
+                if stream:
+                    response = await self._astream_completion(kwargs, stop_when)
+                else:
+                    response = await litellm.acompletion(**kwargs)
+                latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                return self._parse_response(response, model, latency_ms)
+
+            except Exception as e:
+                last_error = e
+                if attempt < self.config.max_retries - 1:
+                    await asyncio.sleep(delay)
+                    delay *= self.config.retry_multiplier
+
+        raise RuntimeError(f"LLM call failed after {self.config.max_retries} retries: {last_error}")
+
+    async def _astream_completion(
+        self, kwargs: dict[str, Any], stop_when: Callable[[str], bool]
+    ) -> Any:
+        """Stream a completion, stopping early once `stop_when` accepts the text.
+
+        Returns:
+            A litellm response rebuilt from the chunks received.
+        """
+        stream = await litellm.acompletion(**kwargs)
+        chunks = []
+        text = ""
+        has_tool_calls = False
+        try:
+            async for chunk in stream:
+                chunks.append(chunk)
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if getattr(delta, "tool_calls", None):
+                    has_tool_calls = True
+                piece = getattr(delta, "content", None)
+                if not piece:
+                    continue
+                text += piece
+                # A JSON answer can only become complete on a closing brace
+                if not has_tool_calls and "}" in piece and stop_when(text):
+                    break
+        finally:
+            await stream.aclose()
+
+        return litellm.stream_chunk_builder(chunks, messages=kwargs["messages"])
+
+    @staticmethod
+    def _run_tool(
+        tool_executor: Callable[[str, dict[str, Any]], Any],
+        name: str,
+        args: dict[str, Any],
+    ) -> str:
+        """Run one tool and serialize its result (or error) as JSON."""
+        try:
+            return json.dumps(tool_executor(name, args))
+        except Exception as e:
+            return json.dumps({"error": str(e)})
+
+    @staticmethod
+    def _parse_tool_calls(response: LLMResponse) -> list[tuple[str, str, dict[str, Any]]]:
+        """Extract (id, name, args) for each tool call in a response."""
+        calls = []
+        for tc in response.tool_calls:
+            func = tc["function"]
+            args_str = func["arguments"]
+
+            # Parse arguments
+            try:
+                args = from_json(args_str) if args_str else {}
+            except ValueError:
+                args = {}
+
+            calls.append((tc["id"], func["name"], args))
+        return calls
+
+    @staticmethod
+    def _tool_outputs(
+        calls: list[tuple[str, str, dict[str, Any]]],
+        results: list[str],
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Pair tool calls with their results.
+
+        Returns:
+            Tuple of (tool result messages, tool call records).
+        """
+        tool_results = []
+        records = []
+        for (call_id, name, args), result_str in zip(calls, results):
+            tool_results.append({
+                "tool_call_id": call_id,
+                "role": "tool",
+                "content": result_str,
+            })
+
+            records.append({
+                "tool_name": name,
+                "arguments": args,
+                "result": result_str,
+            })
+
+        return tool_results, records
+
+    def _execute_tool_calls(
+        self,
+        response: LLMResponse,
+        tool_executor: Callable[[str, dict[str, Any]], Any],
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Execute the tool calls in a response.
+
+        Returns:
+            Tuple of (tool result messages, tool call records).
+        """
+        calls = self._parse_tool_calls(response)
+        results = [self._run_tool(tool_executor, name, args) for _, name, args in calls]
+        return self._tool_outputs(calls, results)
+
+    def _assistant_message(self, response: LLMResponse) -> dict[str, Any]:
+        """Build the assistant message that carries a response's tool calls."""
+        # Preserve reasoning_details for multi-turn (required for Gemini, Anthropic, etc.)
+        # See: https://openrouter.ai/docs/guides/best-practices/reasoning-tokens#preserving-reasoning-blocks
+        assistant_msg: dict[str, Any] = {
+            "role": "assistant",
+            "content": response.content,
+            "tool_calls": response.tool_calls,
+        }
+        if response.reasoning_details and self.config.reasoning.preserve_blocks:
+            assistant_msg["reasoning_details"] = response.reasoning_details
+        return assistant_msg
+
     def call_with_tools(
         self,
         messages: list[dict[str, Any]],
         tools: list[dict[str, Any]],
-        tool_executor: callable,
+        tool_executor: Callable[[str, dict[str, Any]], Any],
         max_turns: int = 5,
         model: str | None = None,
     ) -> tuple[LLMResponse, list[dict[str, Any]]]:
@@ -295,53 +524,84 @@ class LLMAdapter:
                 # No more tool calls, return final response
                 return response, all_tool_calls
 
-            # Execute each tool call
-            tool_results = []
-            for tc in response.tool_calls:
-                func = tc["function"]
-                name = func["name"]
-                args_str = func["arguments"]
-
-                # Parse arguments
-                import json
-                try:
-                    args = json.loads(args_str) if args_str else {}
-                except json.JSONDecodeError:
-                    args = {}
-
-                # Execute tool
-                try:
-                    result = tool_executor(name, args)
-                    result_str = json.dumps(result)
-                except Exception as e:
-                    result_str = json.dumps({"error": str(e)})
-
-                tool_results.append({
-                    "tool_call_id": tc["id"],
-                    "role": "tool",
-                    "content": result_str,
-                })
+            tool_results, records = self._execute_tool_calls(response, tool_executor)
+            all_tool_calls.extend(records)
 
-                all_tool_calls.append({
-                    "tool_name": name,
-                    "arguments": args,
-                    "result": result_str,
-                })
+            # Add assistant message with tool calls, then the tool results
+            current_messages.append(self._assistant_message(response))
+            current_messages.extend(tool_results)
 
-            # Add assistant message with tool calls
-            # Preserve reasoning_details for multi-turn (required for Gemini, Anthropic, etc.)
-            # See: https://openrouter.ai/docs/guides/best-practices/reasoning-tokens#preserving-reasoning-blocks
-            assistant_msg: dict[str, Any] = {
-                "role": "assistant",
-                "content": response.content,
-                "tool_calls": response.tool_calls,
-            }
-            if response.reasoning_details and self.config.reasoning.preserve_blocks:
-                assistant_msg["reasoning_details"] = response.reasoning_details
-            current_messages.append(assistant_msg)
+        # Max turns reached, return last response
+        return response, all_tool_calls
+
+    async def acall_with_tools(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]],
+        tool_executor: Callable[[str, dict[str, Any]], Any],
+        max_turns: int = 5,
+        model: str | None = None,
+        stop_when: Callable[[str], bool] | None = None,
+    ) -> tuple[LLMResponse, list[dict[str, Any]]]:
+        """Async variant of `call_with_tools`.
+
+        Takes the same arguments as `call_with_tools`, plus `stop_when`,
+        which is passed to `acall` for early stopping of streamed responses.
+        """
+        current_messages = messages.copy()
+        all_tool_calls = []
+
+        for _ in range(max_turns):
+            response = await self.acall(
+                current_messages, tools=tools, model=model, stop_when=stop_when
+            )
+
+            if not response.tool_calls:
+                # No more tool calls, return final response
+                return response, all_tool_calls
 
-            # Add tool results
+            # The memory tools are in-process Python over unlocked lazy caches,
+            # so they run inline and in order; threads would add no speed
+            tool_results, records = self._execute_tool_calls(response, tool_executor)
+            all_tool_calls.extend(records)
+
+            # Add assistant message with tool calls, then the tool results
+            current_messages.append(self._assistant_message(response))
             current_messages.extend(tool_results)
 
         # Max turns reached, return last response
         return response, all_tool_calls
+
+
+# Holds each thread's `loop` for run_sync
+_sync_loops = threading.local()
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    Each thread reuses its own event loop across calls so litellm's cached
+    async HTTP clients stay bound to a live loop, and threads never share one.
+
+    Args:
+        coro: The coroutine to run.
+
+    Returns:
+        The coroutine's result.
+
+    Raises:
+        RuntimeError: If an event loop is already running in this thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError(
+            "run_sync() cannot be called from a running event loop; await the coroutine instead"
+        )
+    loop = getattr(_sync_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _sync_loops.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(coro)
@@ -178,16 +178,19 @@ class AgentLogger:
             # Calculate token usage
             total_prompt_tokens = 0
             total_completion_tokens = 0
+            total_cached_tokens = 0
             for trace in traces:
                 for resp in trace.get("llm_responses", []):
                     usage = resp.get("usage", {})
                     total_prompt_tokens += usage.get("prompt_tokens", 0)
                     total_completion_tokens += usage.get("completion_tokens", 0)
+                    total_cached_tokens += usage.get("cached_tokens", 0)
 
             data["token_usage"] = {
                 "prompt_tokens": total_prompt_tokens,
                 "completion_tokens": total_completion_tokens,
                 "total_tokens": total_prompt_tokens + total_completion_tokens,
+                "cached_prompt_tokens": total_cached_tokens,
             }
 
             with open(filepath, "w") as f:
@@ -99,6 +99,183 @@ class TestCheckActionParsing:
         assert action.raise_to == 30
 
 
+class TestNearMissNormalization:
+    """Tests for near-miss responses that are normalized instead of retried."""
+
+    def _create_observation(self, legal_actions: list[str], current_bet: int = 0) -> Observation:
+        """Helper to create a test observation."""
+        return Observation(
+            hand_number=1,
+            street="flop",
+            my_seat=1,
+            my_position="SB",
+            my_hole_cards=("Ah", "Kh"),
+            my_stack=100,
+            community_cards=("2c", "8d", "9c"),
+            pot_size=12,
+            current_bet=current_bet,
+            min_raise=4,
+            max_raise=100,
+            small_blind=1,
+            big_blind=2,
+            button_seat=2,
+            players=[{"seat": 1, "name": "Test", "stack": 100, "is_active": True, "is_folded": False}],
+            actions_this_hand=[],
+            legal_actions=legal_actions,
+        )
+
+    def test_bet_maps_to_raise_with_string_amount(self):
+        """Test that 'bet' with a formatted string amount becomes a raise."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation(["fold", "check", "raise"])
+
+        response = '{"action": " Bet ", "raise_to": "1,500 chips", "reasoning": "Value"}'
+
+        action = agent._parse_action(response, obs)
+
+        assert action is not None
+        assert action.action == "raise"
+        assert action.raise_to == 1500
+
+    def test_decimal_string_amount_keeps_its_value(self):
+        """Test that a decimal point is not dropped from a string amount."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation(["fold", "check", "raise"])
+
+        action = agent._parse_action('{"action": "raise", "raise_to": "60.00", "reasoning": "Value"}', obs)
+
+        assert action is not None
+        assert action.raise_to == 60
+
+    def test_negative_string_amount_is_rejected(self):
+        """Test that a negative amount is not turned into a positive one."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation(["fold", "check", "raise"])
+
+        response = '{"action": "raise", "raise_to": "-50", "reasoning": "Value"}'
+
+        assert agent._parse_action(response, obs) is None
+
+    def test_exponent_string_amount_is_rejected(self):
+        """Test that exponent notation is not read as a plain chip count."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation(["fold", "check", "raise"])
+
+        response = '{"action": "raise", "raise_to": "1e2", "reasoning": "Value"}'
+
+        assert agent._parse_action(response, obs) is None
+
+    def test_huge_string_amount_is_not_rounded_or_crashing(self):
+        """Test that a very long digit string is parsed exactly and then rejected."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation(["fold", "check", "raise"])
+
+        response = f'{{"action": "raise", "raise_to": "{"9" * 400}", "reasoning": "Value"}}'
+        action = agent._parse_action(response, obs)
+
+        assert action is not None
+        assert action.raise_to == int("9" * 400)
+        assert not agent._validate_action(action, obs)[0]
+
+        response = f'{{"action": "raise", "raise_to": "{"9" * 5000}", "reasoning": "Value"}}'
+        assert agent._parse_action(response, obs) is None
+
+        response = '{"action": "raise", "raise_to": "9007199254740993", "reasoning": "Value"}'
+        assert agent._parse_action(response, obs).raise_to == 2**53 + 1
+
+    def test_raise_amount_recovered_from_reasoning(self):
+        """Test that a missing raise_to is recovered from the reasoning text."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation(["fold", "call", "raise"], current_bet=10)
+
+        response = '{"action": "raise", "raise_to": null, "reasoning": "I will raise to 30 here"}'
+
+        action = agent._parse_action(response, obs)
+
+        assert action is not None
+        assert action.raise_to == 30
+
+    def test_raise_multiplier_in_reasoning_is_not_recovered(self):
+        """Test that a pot multiplier in the reasoning is not taken as the amount."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation(["fold", "call", "raise"], current_bet=10)
+
+        response = '{"action": "raise", "raise_to": null, "reasoning": "I will raise 3x the pot"}'
+
+        assert agent._parse_action(response, obs) is None
+
+    def test_all_in_uses_max_raise(self):
+        """Test that an all-in alias raises to the maximum."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation(["fold", "call", "raise"], current_bet=10)
+
+        action = agent._parse_action('{"action": "all-in", "reasoning": "Shove"}', obs)
+
+        assert action is not None
+        assert action.action == "raise"
+        assert action.raise_to == 100
+
+    def test_call_with_nothing_to_call_becomes_check(self):
+        """Test that 'call' is mapped to 'check' when there is nothing to call."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation(["fold", "check", "raise"])
+
+        action = agent._parse_action('{"action": "call", "raise_to": null, "reasoning": "Free card"}', obs)
+
+        assert action is not None
+        assert agent._validate_action(action, obs) == (True, "")
+        assert action.action == "check"
+
+    def test_check_facing_bet_is_not_mapped_to_call(self):
+        """Test that 'check' facing a bet is left for validation to reject."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation(["fold", "call", "raise"], current_bet=10)
+
+        action = agent._parse_action('{"action": "check", "raise_to": null, "reasoning": "?"}', obs)
+
+        assert action is not None
+        assert action.action == "check"
+        assert not agent._validate_action(action, obs)[0]
+
+    def test_raise_above_maximum_is_clamped(self):
+        """Test that a raise a little over the maximum becomes an all-in."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation(["fold", "call", "raise"], current_bet=10)
+        action = AgentAction(action="raise", raise_to=150, reasoning="Shove")
+
+        assert agent._validate_action(action, obs) == (True, "")
+        assert action.raise_to == 100
+        assert action.reasoning == "Shove [raise_to 150 clamped to 100]"
+
+    def test_raise_far_above_maximum_is_rejected(self):
+        """Test that a raise far over the maximum is treated as an error."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation(["fold", "call", "raise"], current_bet=10)
+        action = AgentAction(action="raise", raise_to=6000, reasoning="Value")
+
+        assert agent._validate_action(action, obs) == (False, "Raise to 6000 exceeds maximum 100")
+        assert action.raise_to == 6000
+
+    def test_raise_below_minimum_snaps_up(self):
+        """Test that a sub-minimum raise is snapped up to the minimum."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation(["fold", "call", "raise"], current_bet=2)
+        action = AgentAction(action="raise", raise_to=3, reasoning="Min raise")
+
+        assert agent._validate_action(action, obs) == (True, "")
+        assert action.raise_to == 4
+        assert action.reasoning == "Min raise [raise_to 3 clamped to 4]"
+
+    def test_raise_far_below_minimum_is_rejected(self):
+        """Test that a raise far under the minimum is treated as an error."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation(["fold", "call", "raise"], current_bet=2)
+        action = AgentAction(action="raise", raise_to=1, reasoning="Min raise")
+
+        assert agent._validate_action(action, obs) == (False, "Raise to 1 below minimum 4")
+        assert action.reasoning == "Min raise"
+
+
 class TestFoldValidation:
     """Tests for fold action validation edge cases."""
 
@@ -348,30 +525,6 @@ class TestMarkdownCodeBlockParsing:
         assert action is not None
         assert action.action == "check"
 
-    def test_extract_json_from_markdown_helper(self):
-        """Test the _extract_json_from_markdown helper directly."""
-        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
-
-        # With json tag - only extracts blocks containing "action"
-        text = '```json\n{"action": "check"}\n```'
-        assert agent._extract_json_from_markdown(text) == '{"action": "check"}'
-
-        # Without language tag
-        text = '```\n{"action": "fold"}\n```'
-        assert agent._extract_json_from_markdown(text) == '{"action": "fold"}'
-
-        # Plain text (no code block) returns None
-        text = '{"action": "value"}'
-        assert agent._extract_json_from_markdown(text) is None
-
-        # With surrounding text - returns content from code block
-        text = 'Some text\n```json\n{"action": "raise"}\n```\nMore text'
-        assert agent._extract_json_from_markdown(text) == '{"action": "raise"}'
-        
-        # Code block without "action" key returns None
-        text = '```json\n{"key": "value"}\n```'
-        assert agent._extract_json_from_markdown(text) is None
-
     def test_multiple_code_blocks_uses_first(self):
         """Test that when multiple code blocks exist, we still find the JSON."""
         agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
@@ -395,3 +548,30 @@ And my decision:
         assert action is not None
         assert action.action == "check"
 
+    def test_nested_json_object(self):
+        """Test that an action object with a nested object is parsed."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation()
+
+        response = 'Decision: {"action": "raise", "raise_to": 12, "meta": {"confidence": 0.8}, "reasoning": "Value {thin}"} done.'
+
+        action = agent._parse_action(response, obs)
+
+        assert action is not None
+        assert action.action == "raise"
+        assert action.raise_to == 12
+        assert action.reasoning == "Value {thin}"
+
+    def test_long_response_with_tool_chatter(self):
+        """Test that the action is found after a long run of unrelated JSON."""
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        obs = self._create_observation()
+
+        chatter = '{"tool": "recall_my_hands", "result": {"hands": [1, 2, 3]}} ' * 100
+        response = chatter + '{"action": "raise", "raise_to": 12, "reasoning": "Value"} {"note": 1}'
+
+        action = agent._parse_action(response, obs)
+
+        assert action is not None
+        assert action.action == "raise"
+        assert action.raise_to == 12
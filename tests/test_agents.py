@@ -67,6 +67,50 @@ class TestAgentMemory:
         assert hand is not None
         assert hand.hand_number == 1
 
+    def test_hand_action_groupings(self):
+        memory = AgentMemory("TestAgent", seat=1)
+        memory.start_hand(1, ("Ah", "Kh"), "BTN")
+        memory.record_action("preflop", 2, "Opponent", "raise", 10)
+        memory.record_action("preflop", 1, "TestAgent", "call", 10)
+        memory.record_action("flop", 2, "Opponent", "bet", 20)
+        memory.end_hand("won", 50, 50, 150)
+
+        hand = memory.get_hand(1)
+        assert [a.action for a in hand.get_opponent_actions(2)] == ["raise", "bet"]
+        assert [a.seat for a in hand.get_actions_by_street("preflop")] == [2, 1]
+        assert hand.get_actions_by_street("river") == []
+
+    def test_find_actions_last(self):
+        memory = AgentMemory("TestAgent", seat=1)
+        memory.start_hand(1, ("Ah", "Kh"), "BTN")
+        memory.record_action("preflop", 2, "Opponent", "raise", 10)
+        memory.record_action("preflop", 1, "TestAgent", "call", 10)
+        memory.record_action("flop", 2, "Opponent", "bet", 20)
+        memory.end_hand("won", 50, 50, 150)
+
+        # Single filter and combined filters take different paths; both agree
+        assert [a.action for _, a in memory.find_actions(seat=2, last=1)] == ["bet"]
+        assert [a.action for _, a in memory.find_actions(seat=2, street="flop", last=1)] == ["bet"]
+        for last in (0, -1):
+            assert memory.find_actions(seat=2, last=last) == []
+            assert memory.find_actions(seat=2, street="flop", last=last) == []
+            assert memory.find_actions(last=last) == []
+
+    def test_memory_to_dict(self):
+        memory = AgentMemory("TestAgent", seat=1)
+        memory.start_hand(1, ("Ah", "Kh"), "BTN")
+        memory.record_action("preflop", 2, "Opponent", "raise", 10)
+        memory.record_showdown(2, ("Qd", "Qc"))
+        memory.end_hand("won", 50, 50, 150)
+
+        d = memory.to_dict()
+        hand = d["hands"][0]
+        assert hand["actions"] == [
+            {"street": "preflop", "seat": 2, "player_name": "Opponent", "action": "raise", "amount": 10}
+        ]
+        assert hand["showdown_cards"] == {"2": ("Qd", "Qc")}
+        assert memory.to_dict()["hands"][0] is hand
+
     def test_get_winning_hands(self):
         memory = AgentMemory("TestAgent", seat=1)
 
@@ -80,6 +124,10 @@ class TestAgentMemory:
         assert len(winning) == 1
         assert winning[0].hand_number == 1
 
+        # A result written without interning still counts
+        memory.hands[1].result = "".join(["w", "on"])
+        assert [h.hand_number for h in memory.get_winning_hands()] == [1, 2]
+
     def test_search_observations(self):
         memory = AgentMemory("TestAgent", seat=1)
 
@@ -101,6 +149,14 @@ class TestAgentMemory:
         assert len(results) == 1
         assert results[0].hand_number == 2
 
+        # Every word of a multi-word query must match somewhere in the hand
+        assert [h.hand_number for h in memory.search_observations("opponent raise")] == [1]
+        assert memory.search_observations("opponent folded") == []
+
+        # Case-insensitive, and a query never spans two separate fields
+        assert len(memory.search_observations("OPPONENT")) == 1
+        assert memory.search_observations("khbtn") == []
+
 
 class TestPositionName:
     """Tests for position naming."""
@@ -162,6 +218,14 @@ class TestMemoryTools:
         result = recall_opponent_actions(memory, opponent_seat=2)
         assert result["total_actions_found"] > 0
 
+    def test_recall_opponent_actions_includes_showdowns(self):
+        memory = self._setup_memory_with_hands()
+
+        result = recall_opponent_actions(memory, opponent_seat=2)
+        assert [s["hand_number"] for s in result["showdowns"]] == [1, 3]
+        assert result["showdowns"][1]["cards"] == ["Ah", "Ad"]
+        assert memory.get_showdowns_by_opponent(3) == []
+
     def test_recall_opponent_actions_with_filter(self):
         memory = self._setup_memory_with_hands()
 
@@ -170,6 +234,16 @@ class TestMemoryTools:
         for action in result["actions"]:
             assert "raise" in action["action"].lower()
 
+    def test_recall_opponent_actions_combined_filters(self):
+        memory = self._setup_memory_with_hands()
+
+        result = recall_opponent_actions(memory, opponent_name="OPPONENT1", street="Preflop")
+        assert [a["hand_number"] for a in result["actions"]] == [1, 3]
+
+        # Own actions are never returned, even when asked for by seat
+        assert recall_opponent_actions(memory, opponent_seat=1)["total_actions_found"] == 0
+        assert recall_opponent_actions(memory, action_type="fold")["total_actions_found"] == 0
+
     def test_recall_my_hands(self):
         memory = self._setup_memory_with_hands()
 
@@ -183,6 +257,14 @@ class TestMemoryTools:
         assert len(result["hands"]) == 1
         assert result["hands"][0]["result"] == "won"
 
+    def test_recall_my_hands_limit_keeps_most_recent(self):
+        memory = self._setup_memory_with_hands()
+
+        result = recall_my_hands(memory, limit=2)
+        assert [h["hand_number"] for h in result["hands"]] == [2, 3]
+        assert result["wins"] == 1
+        assert result["folds"] == 1
+
     def test_search_observations(self):
         memory = self._setup_memory_with_hands()
 
@@ -224,6 +306,39 @@ class TestObservation:
         assert d["hand_number"] == 1
         assert d["my_hole_cards"] == ["Ah", "Kh"]
         assert d["legal_actions"] == ["fold", "call", "raise"]
+        assert obs.to_dict() is d
+        assert obs.legal_action_set == frozenset({"fold", "call", "raise"})
+
+    def test_observation_freezes_table_state(self):
+        players = [{"seat": 1, "name": "Test", "stack": 100, "is_active": True, "is_folded": False}]
+        obs = Observation(
+            hand_number=1,
+            street="preflop",
+            my_seat=1,
+            my_position="BTN",
+            my_hole_cards=("Ah", "Kh"),
+            my_stack=100,
+            community_cards=(),
+            pot_size=3,
+            current_bet=2,
+            min_raise=4,
+            max_raise=100,
+            small_blind=1,
+            big_blind=2,
+            button_seat=1,
+            players=players,
+            actions_this_hand=[{"street": "preflop", "seat": 2, "action": "raise", "amount": 2}],
+        )
+
+        players[0]["stack"] = 0
+        with pytest.raises(TypeError):
+            obs.players[0]["stack"] = 0
+        assert obs.player_stacks == (100,)
+        assert obs.player_folded == (False,)
+
+        d = obs.to_dict()
+        assert d["players"] == [{"seat": 1, "name": "Test", "stack": 100, "is_active": True, "is_folded": False}]
+        assert d["actions_this_hand"] == [{"street": "preflop", "seat": 2, "action": "raise", "amount": 2}]
 
 
 class TestAgentAction:
@@ -245,3 +360,388 @@ class TestAgentAction:
         action = AgentAction(action="fold", reasoning="Weak hand")
         assert action.action == "fold"
         assert action.raise_to is None
+
+
+class StubLLM:
+    """Stand-in for LLMAdapter that replays canned response texts."""
+
+    def __init__(self, contents: list):
+        self.contents = list(contents)
+        self.calls = 0
+
+    async def acall_with_tools(self, messages, tools, tool_executor, max_turns=5, model=None, stop_when=None):
+        from live_poker_bench.llm.adapter import LLMResponse
+
+        self.calls += 1
+        self.last_tools = tools
+        content = self.contents.pop(0)
+        if isinstance(content, LLMResponse):
+            return content, []
+        return LLMResponse(content=content), []
+
+
+def _make_observation(legal_actions: list[str], current_bet: int = 0) -> Observation:
+    return Observation(
+        hand_number=1,
+        street="flop",
+        my_seat=1,
+        my_position="SB",
+        my_hole_cards=("Ah", "Kh"),
+        my_stack=100,
+        community_cards=("2c", "8d", "9c"),
+        pot_size=12,
+        current_bet=current_bet,
+        min_raise=4,
+        max_raise=100,
+        small_blind=1,
+        big_blind=2,
+        button_seat=2,
+        players=[{"seat": 1, "name": "Test", "stack": 100, "is_active": True, "is_folded": False}],
+        actions_this_hand=[],
+        legal_actions=legal_actions,
+    )
+
+
+class TestLLMAgentDecisionLoop:
+    """Tests for LLMAgent.get_action with a stubbed LLM."""
+
+    def _agent(self, contents: list[str | None], **kwargs):
+        from live_poker_bench.agents.llm_agent import LLMAgent
+
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1, **kwargs)
+        agent.llm = StubLLM(contents)
+        return agent
+
+    def test_sync_wrapper_returns_action(self):
+        agent = self._agent(['{"action": "check", "raise_to": null, "reasoning": "free card"}'])
+        action = agent.get_action(_make_observation(["fold", "check", "raise"]))
+
+        assert action.action == "check"
+        assert action.retries == 0
+        assert len(agent.decision_traces) == 1
+
+    def test_async_retries_on_invalid_response(self):
+        import asyncio
+
+        agent = self._agent([
+            "I think I'll check",
+            '{"action": "check", "raise_to": null, "reasoning": "free card"}',
+        ])
+        action = asyncio.run(agent.aget_action(_make_observation(["fold", "check", "raise"])))
+
+        assert action.action == "check"
+        assert action.retries == 1
+        assert agent.llm.calls == 2
+
+    def test_retries_only_resend_latest_failure(self):
+        agent = self._agent([
+            "I think I'll check",
+            "Still thinking",
+            '{"action": "check", "raise_to": null, "reasoning": "free card"}',
+        ])
+        sent = []
+        replay = agent.llm.acall_with_tools
+
+        async def record(messages, *args, **kwargs):
+            sent.append(list(messages))
+            return await replay(messages, *args, **kwargs)
+
+        agent.llm.acall_with_tools = record
+        action = agent.get_action(_make_observation(["fold", "check", "raise"]))
+
+        assert action.retries == 2
+        assert [len(m) for m in sent] == [2, 4, 4]
+        assert sent[2][2]["content"] == "Still thinking"
+        assert len(agent.get_last_trace()["messages"]) == 6
+
+    def test_sampled_alternative_avoids_retry(self):
+        from live_poker_bench.llm.adapter import LLMResponse
+
+        agent = self._agent([
+            LLMResponse(
+                content="check, probably",
+                alternatives=['{"action": "check", "raise_to": null, "reasoning": "free card"}'],
+            ),
+        ])
+        action = agent.get_action(_make_observation(["fold", "check", "raise"]))
+
+        assert action.action == "check"
+        assert action.retries == 0
+        assert agent.llm.calls == 1
+        assert agent.decision_traces[0].llm_responses[0]["alternatives"]
+
+    def test_tools_offered_only_once_memory_has_hands(self):
+        content = '{"action": "call", "raise_to": null, "reasoning": "odds"}'
+        agent = self._agent([content, content])
+        obs = _make_observation(["fold", "call", "raise"], current_bet=2)
+
+        agent.get_action(obs)
+        assert agent.llm.last_tools == []
+
+        agent.memory.start_hand(1, ("Ah", "Kh"), "BTN")
+        agent.memory.end_hand("won", 10, 10, 110)
+        agent.get_action(obs)
+        assert agent.llm.last_tools
+
+    def test_unseated_agent_decides_without_tools(self):
+        from live_poker_bench.agents.llm_agent import LLMAgent
+
+        agent = LLMAgent(name="TestAgent", model="test/model")
+        agent.llm = StubLLM(['{"action": "call", "raise_to": null, "reasoning": "odds"}'])
+        action = agent.get_action(_make_observation(["fold", "call", "raise"], current_bet=2))
+
+        assert action.action == "call"
+        assert agent.llm.last_tools == []
+
+    def test_single_sensible_action_skips_llm(self):
+        agent = self._agent([])
+        action = agent.get_action(_make_observation(["fold", "check"]))
+
+        assert action.action == "check"
+        assert agent.llm.calls == 0
+        assert agent.get_last_trace()["final_action"]["action"] == "check"
+        assert agent.get_traces(limit=1) == [agent.get_last_trace()]
+        assert agent.get_traces(limit=0) == []
+
+    def test_anthropic_system_prompt_is_cacheable(self):
+        from live_poker_bench.agents.llm_agent import LLMAgent
+
+        claude = LLMAgent(name="A", model="openrouter/anthropic/claude-sonnet-4", seat=1)
+        gpt = LLMAgent(name="B", model="openrouter/openai/gpt-4o", seat=2)
+
+        assert claude._system_message["content"][0]["cache_control"] == {"type": "ephemeral"}
+        assert claude._tools[-1]["cache_control"] == {"type": "ephemeral"}
+        assert isinstance(gpt._system_message["content"], str)
+        assert all("cache_control" not in tool for tool in gpt._tools)
+
+    def test_agents_with_same_settings_share_adapter(self):
+        from live_poker_bench.agents.llm_agent import LLMAgent
+
+        a = LLMAgent(name="A", model="openrouter/openai/gpt-4o", seat=1)
+        b = LLMAgent(name="B", model="openrouter/openai/gpt-4o", seat=2)
+        c = LLMAgent(name="C", model="openrouter/openai/gpt-4o", seat=3, n_samples=2)
+
+        assert a.llm is b.llm
+        assert c.llm is not a.llm
+
+    def test_decision_cache_skips_llm_for_repeated_state(self):
+        agent = self._agent(
+            ['{"action": "raise", "raise_to": 8, "reasoning": "value"}'],
+            config={"enable_decision_cache": True},
+        )
+        first = agent.get_action(_make_observation(["fold", "call", "raise"], current_bet=2))
+        second = agent.get_action(_make_observation(["fold", "call", "raise"], current_bet=2))
+
+        assert agent.llm.calls == 1
+        assert (second.action, second.raise_to) == (first.action, first.raise_to)
+        assert second is not first
+        assert agent.get_last_trace()["cached"] is True
+
+    def test_near_match_cache_reuses_similar_state(self):
+        from dataclasses import replace
+
+        agent = self._agent(
+            ['{"action": "raise", "raise_to": 8, "reasoning": "value"}'],
+            config={"enable_near_match_cache": True},
+        )
+        obs = _make_observation(["fold", "call", "raise"], current_bet=2)
+        agent.get_action(obs)
+        similar = replace(obs, my_hole_cards=("As", "Ks"), community_cards=("3d", "8h", "9d"), my_stack=96)
+        action = agent.get_action(similar)
+
+        assert agent.llm.calls == 1
+        assert (action.action, action.raise_to) == ("raise", 8)
+        assert agent.get_last_trace()["cached"] is True
+
+
+class TestAdaptiveToolTurns:
+    """Tests for dropping tool definitions for agents that never use them."""
+
+    def test_tools_dropped_then_reoffered(self):
+        from live_poker_bench.agents.llm_agent import LLMAgent, _TOOL_PROBE_INTERVAL
+
+        agent = LLMAgent(
+            name="TestAgent", model="test/model", seat=1, config={"adaptive_tool_turns": True}
+        )
+        agent._avg_tools_used = 0.0
+
+        offered = [agent._should_offer_tools() for _ in range(_TOOL_PROBE_INTERVAL)]
+
+        assert offered == [False] * (_TOOL_PROBE_INTERVAL - 1) + [True]
+
+    def test_disabled_by_default(self):
+        from live_poker_bench.agents.llm_agent import LLMAgent
+
+        agent = LLMAgent(name="TestAgent", model="test/model", seat=1)
+        agent._avg_tools_used = 0.0
+
+        assert agent._should_offer_tools()
+
+
+class TestSharedAdapters:
+    """Tests for sharing one LLMAdapter between agents with identical settings."""
+
+    def test_identical_settings_share_adapter(self):
+        from live_poker_bench.agents.llm_agent import LLMAgent
+
+        provider = {"order": ["a", "b"], "data_collection": "deny"}
+        first = LLMAgent(name="A", model="test/shared", provider=provider)
+        second = LLMAgent(name="B", model="test/shared", provider=dict(provider))
+        other = LLMAgent(name="C", model="test/shared", provider={"order": ["b", "a"]})
+
+        assert first.llm is second.llm
+        assert other.llm is not first.llm
+
+    def test_adapter_released_with_last_agent(self):
+        import gc
+
+        from live_poker_bench.agents.llm_agent import LLMAgent
+
+        before = len(LLMAgent._adapters)
+        agent = LLMAgent(name="A", model="test/released")
+        assert len(LLMAgent._adapters) == before + 1
+
+        del agent
+        gc.collect()
+
+        assert len(LLMAgent._adapters) == before
+
+
+class TestRunSync:
+    """Tests for running agent coroutines from synchronous code."""
+
+    def test_reuses_loop_within_thread(self):
+        import asyncio
+
+        from live_poker_bench.llm.adapter import run_sync
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        assert run_sync(current_loop()) is run_sync(current_loop())
+
+    def test_threads_get_separate_loops(self):
+        import asyncio
+        import threading
+
+        from live_poker_bench.llm.adapter import run_sync
+
+        barrier = threading.Barrier(4)
+        loops = []
+
+        async def wait_together():
+            # Every thread is inside run_sync at the same time here
+            await asyncio.to_thread(barrier.wait, 5)
+            return asyncio.get_running_loop()
+
+        threads = [
+            threading.Thread(target=lambda: loops.append(run_sync(wait_together())))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(loops) == 4
+        assert len({id(loop) for loop in loops}) == 4
+
+    def test_rejects_running_loop(self):
+        import asyncio
+
+        from live_poker_bench.llm.adapter import run_sync
+
+        async def nested():
+            async def inner():
+                return 1
+
+            with pytest.raises(RuntimeError, match="running event loop"):
+                run_sync(inner())
+
+        asyncio.run(nested())
+
+
+class TestToolCallExecution:
+    """Tests for running several tool calls from one turn."""
+
+    def test_calls_run_in_order_on_calling_thread(self):
+        import threading
+        import time
+
+        from live_poker_bench.llm.adapter import LLMAdapter, LLMConfig, LLMResponse
+
+        adapter = LLMAdapter(LLMConfig(model="test/model"))
+        response = LLMResponse(
+            content=None,
+            tool_calls=[
+                {"id": f"call_{i}", "type": "function",
+                 "function": {"name": "slow", "arguments": f'{{"delay": {d}}}'}}
+                for i, d in enumerate([0.05, 0.0, 0.02])
+            ],
+        )
+
+        executed = []
+
+        def executor(name, args):
+            time.sleep(args["delay"])
+            executed.append((args["delay"], threading.current_thread()))
+            return {"delay": args["delay"]}
+
+        tool_results, records = adapter._execute_tool_calls(response, executor)
+
+        assert [m["tool_call_id"] for m in tool_results] == ["call_0", "call_1", "call_2"]
+        assert [r["arguments"]["delay"] for r in records] == [0.05, 0.0, 0.02]
+        assert executed == [(d, threading.current_thread()) for d in (0.05, 0.0, 0.02)]
+
+
+class TestStreamingEarlyStop:
+    """Tests for the adapter's streamed early-stop path."""
+
+    def test_stream_stops_after_action_json(self, monkeypatch):
+        import asyncio
+
+        import litellm
+        from litellm.types.utils import Delta, ModelResponseStream, StreamingChoices
+
+        from live_poker_bench.agents.llm_agent import _has_action_json
+        from live_poker_bench.llm.adapter import LLMAdapter, LLMConfig
+
+        pieces = ['{"action": "check", ', '"reasoning": "free"}', " Let me also explain", " at length..."]
+        consumed = []
+
+        class FakeStream:
+            def __init__(self):
+                self.closed = False
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                if len(consumed) == len(pieces):
+                    raise StopAsyncIteration
+                piece = pieces[len(consumed)]
+                consumed.append(piece)
+                return ModelResponseStream(
+                    id="x",
+                    model="test/model",
+                    choices=[StreamingChoices(index=0, delta=Delta(content=piece, role="assistant"))],
+                )
+
+            async def aclose(self):
+                self.closed = True
+
+        fake = FakeStream()
+
+        async def fake_acompletion(**kwargs):
+            assert kwargs["stream"] is True
+            return fake
+
+        monkeypatch.setattr(litellm, "acompletion", fake_acompletion)
+        adapter = LLMAdapter(LLMConfig(model="test/model", stream=True))
+        response = asyncio.run(
+            adapter.acall([{"role": "user", "content": "act"}], stop_when=_has_action_json)
+        )
+
+        assert response.content == '{"action": "check", "reasoning": "free"}'
+        assert len(consumed) == 2
+        assert fake.closed
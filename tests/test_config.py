@@ -0,0 +1,156 @@
+"""Unit tests for configuration loading."""
+
+import json
+import os
+
+import pytest
+
+from live_poker_bench.config import (
+    BenchmarkConfig,
+    ConfigWatcher,
+    get_blind_schedule_arrays,
+    get_blind_schedule_config,
+    load_config,
+    parse_config,
+)
+
+
+def _write_config(path, num_agents: int = 2, seats: int = 2) -> None:
+    path.write_text(json.dumps({
+        "tournament": {"seats": seats},
+        "agents": [{"name": f"Agent{i}"} for i in range(num_agents)],
+    }))
+
+
+def _touch_later(path) -> None:
+    """Move the file's mtime forward so a rewrite is seen as a change."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestLoadConfig:
+    """Tests for load_config."""
+
+    def test_load_config(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        _write_config(config_path)
+
+        config = load_config(config_path)
+        assert [a.name for a in config.agents] == ["Agent0", "Agent1"]
+        assert config.tournament.seats == 2
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="Config file not found"):
+            load_config(tmp_path / "missing.json")
+
+    def test_reuses_config_until_file_changes(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        _write_config(config_path)
+
+        config = load_config(config_path)
+        assert load_config(str(config_path)) is config
+
+        _write_config(config_path, num_agents=3, seats=3)
+        _touch_later(config_path)
+
+        reloaded = load_config(config_path)
+        assert reloaded is not config
+        assert len(reloaded.agents) == 3
+
+    def test_agent_count_must_match_seats(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        _write_config(config_path, num_agents=2, seats=3)
+
+        with pytest.raises(ValueError, match="must match tournament seats"):
+            load_config(config_path)
+
+
+class TestParseConfig:
+    """Tests for parse_config."""
+
+    def test_parse_bytes(self):
+        raw = json.dumps({"tournament": {"seats": 2}, "agents": [{"name": "A"}, {"name": "B"}]})
+        config = parse_config(raw.encode())
+        assert [a.name for a in config.agents] == ["A", "B"]
+
+    def test_invalid_json(self):
+        with pytest.raises(ValueError):
+            parse_config(b"{not json")
+
+    def test_agent_count_must_match_seats(self):
+        raw = json.dumps({"tournament": {"seats": 3}, "agents": [{"name": "A"}, {"name": "B"}]})
+        with pytest.raises(ValueError, match="must match tournament seats"):
+            parse_config(raw)
+
+
+class TestBenchmarkConfig:
+    """Tests for constructing BenchmarkConfig directly."""
+
+    def test_defaults_are_constructible(self):
+        config = BenchmarkConfig()
+        assert config.agents == []
+        assert config.tournament.seats == 6
+
+    def test_agent_count_checked_on_request(self):
+        with pytest.raises(ValueError, match="must match tournament seats"):
+            BenchmarkConfig().validate_agent_count()
+
+
+class TestConfigWatcher:
+    """Tests for ConfigWatcher."""
+
+    def test_poll_reloads_only_on_change(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        _write_config(config_path)
+        watcher = ConfigWatcher(config_path)
+        original = watcher.config
+
+        assert not watcher.poll()
+        assert watcher.config is original
+
+        _write_config(config_path, num_agents=3, seats=3)
+        _touch_later(config_path)
+        assert watcher.poll()
+        assert len(watcher.config.agents) == 3
+
+    def test_invalid_edit_keeps_last_config(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        _write_config(config_path)
+        watcher = ConfigWatcher(config_path)
+        original = watcher.config
+
+        _write_config(config_path, num_agents=2, seats=3)
+        _touch_later(config_path)
+        with pytest.raises(ValueError):
+            watcher.poll()
+        assert watcher.config is original
+
+
+class TestBlindScheduleConfig:
+    """Tests for blind schedule conversion."""
+
+    def test_default_schedule_as_dicts(self):
+        config = BenchmarkConfig(agents=[{"name": f"Agent{i}"} for i in range(6)])
+
+        schedule = get_blind_schedule_config(config)
+        assert schedule[0] == {"hands": 20, "sb": 1, "bb": 2}
+        assert schedule[-1] == {"hands": None, "sb": 32, "bb": 64}
+        assert get_blind_schedule_config(config) is schedule
+
+    def test_schedule_must_not_be_empty(self):
+        with pytest.raises(ValueError, match="at least 1 item"):
+            BenchmarkConfig(
+                tournament={"seats": 2, "blind_schedule": []},
+                agents=[{"name": "A"}, {"name": "B"}],
+            )
+
+    def test_schedule_as_arrays(self):
+        config = BenchmarkConfig(
+            tournament={"seats": 2, "blind_schedule": [{"hands": 10, "sb": 5, "bb": 10}, {"sb": 10, "bb": 20}]},
+            agents=[{"name": "A"}, {"name": "B"}],
+        )
+
+        arrays = get_blind_schedule_arrays(config)
+        assert arrays.hands == (10, None)
+        assert arrays.sb == (5, 10)
+        assert arrays.bb == (10, 20)
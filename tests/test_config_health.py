@@ -0,0 +1,305 @@
+"""Unit tests for the configuration health check."""
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+from live_poker_bench import config_health
+from live_poker_bench.config_health import CheckResult, HealthChecker, HealthReport, HealthStatus
+
+
+def _write_config(path, **overrides) -> None:
+    data = {
+        "tournament": {"seats": 2},
+        "agents": [{"name": "A"}, {"name": "B"}],
+        "output": {"log_dir": str(path.parent / "logs")},
+    }
+    data.update(overrides)
+    path.write_text(json.dumps(data))
+
+
+class TestConfigChecks:
+    """Tests for the config file and schema checks."""
+
+    def test_valid_config(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        _write_config(config_path)
+        checker = HealthChecker(config_path, verbose=False)
+
+        assert checker.check_config_file().status == HealthStatus.PASS
+        result = checker.check_config_schema()
+        assert result.status == HealthStatus.PASS
+        assert result.message == "2 agents, 2 seats"
+
+    def test_missing_file(self, tmp_path):
+        checker = HealthChecker(tmp_path / "missing.json", verbose=False)
+        result = checker.check_config_file()
+        assert result.status == HealthStatus.FAIL
+        assert "not found" in result.message
+
+    def test_invalid_json(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        config_path.write_text("{not json")
+        result = HealthChecker(config_path, verbose=False).check_config_file()
+        assert result.status == HealthStatus.FAIL
+        assert result.message.startswith("Invalid JSON")
+
+    def test_schema_error(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        _write_config(config_path, tournament={"seats": 3})
+        checker = HealthChecker(config_path, verbose=False)
+        checker.check_config_file()
+
+        result = checker.check_config_schema()
+        assert result.status == HealthStatus.FAIL
+        assert "must match tournament seats" in result.message
+
+
+class TestRunAll:
+    """Tests for running the full check suite."""
+
+    def test_run_all_without_connectivity(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-test-0123456789")
+        config_path = tmp_path / "config.json"
+        _write_config(config_path)
+
+        report = HealthChecker(config_path, verbose=False).run_all(skip_connectivity=True)
+        assert report.overall_status == HealthStatus.PASS
+        assert report.failed == 0
+
+
+class TestAgentSettingChecks:
+    """Tests for the per-agent reasoning and provider checks."""
+
+    def _checker(self, tmp_path, agents):
+        config_path = tmp_path / "config.json"
+        _write_config(config_path, agents=agents)
+        checker = HealthChecker(config_path, verbose=False)
+        checker.check_config_schema()
+        return checker
+
+    def test_gemini_without_preserve_blocks_warns(self, tmp_path):
+        checker = self._checker(tmp_path, [
+            {"name": "G", "model": "openrouter/Google/Gemini-2.5-pro",
+             "reasoning": {"enabled": True, "preserve_blocks": False}},
+            {"name": "B", "reasoning": {"enabled": True}},
+        ])
+        result = checker.check_reasoning_config()
+        assert result.status == HealthStatus.WARN
+        assert result.message.startswith("G: Gemini models")
+
+    def test_invalid_effort_fails(self, tmp_path):
+        checker = self._checker(tmp_path, [
+            {"name": "A", "reasoning": {"enabled": True, "effort": "max"}},
+            {"name": "B"},
+        ])
+        assert checker.check_reasoning_config().status == HealthStatus.FAIL
+
+    def test_unknown_provider_warns(self, tmp_path):
+        checker = self._checker(tmp_path, [
+            {"name": "A", "provider": {"order": ["OpenAI", "acme"]}},
+            {"name": "B"},
+        ])
+        result = checker.check_provider_config()
+        assert result.status == HealthStatus.WARN
+        assert result.details["all_warnings"] == [
+            "A: unknown provider 'acme' (may be valid, just not in known list)"
+        ]
+
+
+class TestHealthReport:
+    """Tests for HealthReport."""
+
+    def test_counts_and_overall_status(self):
+        report = HealthReport()
+        for status in (HealthStatus.PASS, HealthStatus.PASS, HealthStatus.SKIP, HealthStatus.WARN):
+            report.add(CheckResult(name="check", status=status, message=""))
+
+        assert (report.passed, report.warnings, report.failed) == (2, 1, 0)
+        assert report.overall_status == HealthStatus.WARN
+
+        report.add(CheckResult(name="check", status=HealthStatus.FAIL, message=""))
+        assert report.failed == 1
+        assert report.overall_status == HealthStatus.FAIL
+
+    def test_counts_results_not_added_through_add(self):
+        pass_result = CheckResult(name="check", status=HealthStatus.PASS, message="")
+        warn_result = CheckResult(name="check", status=HealthStatus.WARN, message="")
+        report = HealthReport(results=[pass_result, warn_result])
+        assert (report.passed, report.warnings, report.failed) == (1, 1, 0)
+
+        report.results.append(CheckResult(name="check", status=HealthStatus.FAIL, message=""))
+        assert report.failed == 1
+
+        report.add(pass_result)
+        assert (report.passed, report.warnings, report.failed) == (2, 1, 1)
+
+    def test_as_json(self):
+        report = HealthReport()
+        report.add(CheckResult(
+            name="Dependencies", status=HealthStatus.FAIL, message="Missing: x",
+            details={"missing": ["x"]}, duration_ms=1.5,
+        ))
+
+        assert json.loads(report.as_json()) == {
+            "overall": "fail",
+            "results": [{
+                "name": "Dependencies",
+                "status": "fail",
+                "message": "Missing: x",
+                "details": {"missing": ["x"]},
+                "duration_ms": 1.5,
+            }],
+        }
+
+
+class _FakeAdapter:
+    """Stands in for LLMAdapter, counting calls per model."""
+
+    calls: list[str] = []
+
+    def __init__(self, config):
+        self.config = config
+
+    def call(self, messages):
+        _FakeAdapter.calls.append(self.config.model)
+        return SimpleNamespace(
+            content="HEALTH_CHECK_OK",
+            reasoning_content=None,
+            provider_name=None,
+            usage={"total_tokens": 5},
+        )
+
+
+class TestConnectivity:
+    """Tests for the agent connectivity checks."""
+
+    def test_shared_model_is_probed_once(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-test-0123456789")
+        monkeypatch.setattr(
+            config_health,
+            "_adapter_classes",
+            lambda: (_FakeAdapter, SimpleNamespace, SimpleNamespace, SimpleNamespace),
+        )
+        monkeypatch.setattr(_FakeAdapter, "calls", [])
+        config_path = tmp_path / "config.json"
+        _write_config(
+            config_path,
+            tournament={"seats": 3},
+            agents=[
+                {"name": "A", "model": "m1"},
+                {"name": "B", "model": "m2"},
+                {"name": "C", "model": "m1"},
+            ],
+        )
+
+        report = HealthChecker(config_path, verbose=False).run_all()
+        assert sorted(_FakeAdapter.calls) == ["m1", "m2"]
+        agent_results = [r for r in report.results if r.name.startswith("Agent: ")]
+        assert [r.name for r in agent_results] == ["Agent: A", "Agent: B", "Agent: C"]
+        assert all(r.status == HealthStatus.PASS for r in agent_results)
+
+
+class TestLogDirectory:
+    """Tests for the log directory check."""
+
+    def test_creates_missing_directory(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        _write_config(config_path)
+        checker = HealthChecker(config_path, verbose=False)
+        checker.check_config_schema()
+
+        assert checker.check_log_directory().status == HealthStatus.PASS
+        assert (tmp_path / "logs").is_dir()
+        assert not (tmp_path / "logs" / ".health_check_test").exists()
+
+    def test_skipped_without_config(self, tmp_path):
+        result = HealthChecker(tmp_path / "config.json", verbose=False).check_log_directory()
+        assert result.status == HealthStatus.SKIP
+
+
+class TestBlindScheduleCheck:
+    """Tests for the blind schedule check."""
+
+    def test_default_schedule(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        _write_config(config_path)
+        checker = HealthChecker(config_path, verbose=False)
+        checker.check_config_schema()
+
+        result = checker.check_blind_schedule()
+        assert result.status == HealthStatus.PASS
+        assert result.message == "6 levels, 100+ hands before final level"
+
+    def test_non_increasing_blinds_warn(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        _write_config(config_path, tournament={"seats": 2, "blind_schedule": [
+            {"hands": 10, "sb": 2, "bb": 4},
+            {"hands": 10, "sb": 1, "bb": 2},
+            {"sb": 4, "bb": 8},
+        ]})
+        checker = HealthChecker(config_path, verbose=False)
+        checker.check_config_schema()
+
+        result = checker.check_blind_schedule()
+        assert result.status == HealthStatus.WARN
+        assert result.message == "Level 2 BB (2) not greater than previous (4)"
+
+    def test_adapter_imported_before_workers_start(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-test-0123456789")
+        threads = []
+
+        def adapter_classes():
+            threads.append(threading.current_thread())
+            return _FakeAdapter, SimpleNamespace, SimpleNamespace, SimpleNamespace
+
+        monkeypatch.setattr(config_health, "_adapter_classes", adapter_classes)
+        monkeypatch.setattr(_FakeAdapter, "calls", [])
+        config_path = tmp_path / "config.json"
+        _write_config(config_path)
+
+        HealthChecker(config_path, verbose=False).run_all()
+        assert threads[0] is threading.main_thread()
+
+    def test_adapter_import_failure_fails_every_agent(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-test-0123456789")
+
+        def adapter_classes():
+            raise ImportError("no litellm")
+
+        monkeypatch.setattr(config_health, "_adapter_classes", adapter_classes)
+        config_path = tmp_path / "config.json"
+        _write_config(config_path)
+
+        report = HealthChecker(config_path, verbose=False).run_all()
+        agent_results = [r for r in report.results if r.name.startswith("Agent: ")]
+        assert [r.name for r in agent_results] == ["Agent: A", "Agent: B"]
+        assert all(r.status == HealthStatus.FAIL for r in agent_results)
+
+    def test_results_follow_config_order(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-test-0123456789")
+        config_path = tmp_path / "config.json"
+        _write_config(
+            config_path,
+            tournament={"seats": 3},
+            agents=[{"name": "Slow"}, {"name": "Mid"}, {"name": "Fast"}],
+        )
+        delays = {"Slow": 0.2, "Mid": 0.1, "Fast": 0.0}
+
+        def fake_probe(self, agent_name, model, reasoning_enabled=False, provider_config=None):
+            time.sleep(delays[agent_name])
+            return CheckResult(name=f"Agent: {agent_name}", status=HealthStatus.PASS, message="")
+
+        monkeypatch.setattr(HealthChecker, "check_agent_connectivity", fake_probe)
+        monkeypatch.setattr(
+            config_health,
+            "_adapter_classes",
+            lambda: (_FakeAdapter, SimpleNamespace, SimpleNamespace, SimpleNamespace),
+        )
+        # Give each agent its own probe so none are deduplicated
+        monkeypatch.setattr(config_health, "_probe_key", lambda model, *_: object())
+
+        report = HealthChecker(config_path, verbose=False).run_all()
+        names = [r.name for r in report.results if r.name.startswith("Agent: ")]
+        assert names == ["Agent: Slow", "Agent: Mid", "Agent: Fast"]
@@ -166,6 +166,15 @@ class TestAgentManager:
         # For now, test that configs are parsed correctly
         assert len(configs) == 2
 
+    def test_from_config_applies_agent_settings(self):
+        manager = AgentManager.from_config(
+            [{"name": "Agent1", "model": "test/model1"}, {"name": "Agent2", "model": "test/model2", "stream": False}],
+            {"stream": True},
+        )
+
+        assert manager.get_agent(1).llm.config.stream is True
+        assert manager.get_agent(2).llm.config.stream is False
+
     def test_add_agent(self):
         manager = AgentManager()
         agent = MockAgent("TestAgent")
@@ -184,6 +193,84 @@ class TestAgentManager:
         assert not manager.is_active(1)
         assert manager.is_active(2)
 
+    def test_eliminated_seat_stops_receiving_events(self):
+        manager = AgentManager()
+        manager.add_agent(1, MockAgent("Agent1"))
+        manager.add_agent(2, MockAgent("Agent2"))
+        manager.start_hand(1, {1: ("As", "Kd"), 2: ("7c", "2h")}, button_seat=1)
+
+        manager.eliminate_seat(1)
+        manager.record_action("preflop", 2, "raise", 60)
+
+        assert manager.get_memory(1)._current_hand.actions == []
+        assert len(manager.get_memory(2)._current_hand.actions) == 1
+
+        manager.reset_for_tournament()
+        assert manager.is_active(1)
+        assert manager.get_memory(1) is not None
+
+    def test_get_actions_batch_preserves_order(self):
+        manager = AgentManager()
+        manager.add_agent(1, MockAgent("Folder"))
+        manager.add_agent(2, MockAggressiveAgent("Aggressor"))
+        obs = Observation(
+            hand_number=1,
+            street="preflop",
+            my_seat=1,
+            my_position="SB",
+            my_hole_cards=("Ac", "Js"),
+            my_stack=100,
+            community_cards=(),
+            pot_size=3,
+            current_bet=1,
+            min_raise=4,
+            max_raise=100,
+            small_blind=1,
+            big_blind=2,
+            button_seat=1,
+            players=[],
+            legal_actions=["fold", "call", "raise"],
+        )
+
+        actions = manager.get_actions_batch([(2, obs), (1, obs)])
+
+        assert [a.action for a in actions] == ["raise", "fold"]
+
+    def test_get_actions_batch_overlaps_blocking_agents(self):
+        import time
+
+        class SlowAgent(BaseAgent):
+            def get_action(self, observation: Observation) -> AgentAction:
+                time.sleep(0.2)
+                return AgentAction(action="fold")
+
+        manager = AgentManager()
+        for seat in (1, 2, 3):
+            manager.add_agent(seat, SlowAgent(f"Slow{seat}"))
+        obs = Observation(
+            hand_number=1,
+            street="preflop",
+            my_seat=1,
+            my_position="SB",
+            my_hole_cards=("Ac", "Js"),
+            my_stack=100,
+            community_cards=(),
+            pot_size=3,
+            current_bet=1,
+            min_raise=4,
+            max_raise=100,
+            small_blind=1,
+            big_blind=2,
+            button_seat=1,
+            players=[],
+            legal_actions=["fold", "call", "raise"],
+        )
+
+        start = time.perf_counter()
+        manager.get_actions_batch([(seat, obs) for seat in (1, 2, 3)])
+
+        assert time.perf_counter() - start < 0.5
+
 
 class TestTournamentRunner:
     """Integration tests for TournamentRunner."""